@@ -8,7 +8,7 @@ from .config import (
     KwamiPersonaConfig,
     KwamiMemoryConfig,
 )
-from .memory import KwamiMemory, create_memory
+from .memory import KwamiMemory, create_memory, start_memory
 from .session import SessionState, create_session_state
 
 __all__ = [
@@ -20,6 +20,7 @@ __all__ = [
     "KwamiMemoryConfig",
     "KwamiMemory",
     "create_memory",
+    "start_memory",
     "SessionState",
     "create_session_state",
 ]
@@ -1,5 +1,8 @@
 """Kwami Agent - Dynamic AI agent configured by the Kwami frontend library."""
 
+import io
+import re
+from types import MappingProxyType
 from typing import Any, Optional
 
 from livekit.agents import Agent
@@ -12,6 +15,136 @@ from .utils.room import should_disconnect_as_duplicate
 
 logger = get_logger("agent")
 MAX_SYSTEM_MEMORY_CONTEXT_CHARS = 2200
+MAX_PROMPT_CACHE_ENTRIES = 64
+
+# Response length guidance keyed by soul.response_length
+_LENGTH_GUIDE = MappingProxyType({
+    "short": "Keep responses brief and concise (1-2 sentences).",
+    "medium": "Provide balanced responses with enough detail (2-4 sentences).",
+    "long": "Give comprehensive, detailed responses when appropriate.",
+})
+
+# Emotional tone guidance keyed by soul.emotional_tone
+_TONE_GUIDE = MappingProxyType({
+    "neutral": "Maintain a balanced, objective tone.",
+    "warm": "Express warmth and friendliness in your interactions.",
+    "enthusiastic": "Show enthusiasm and energy in your responses.",
+    "calm": "Maintain a calm, soothing demeanor.",
+    "playful": "Use a light, playful voice while staying helpful.",
+    "confident": "Speak with confident, decisive language.",
+    "serious": "Use a serious, focused, no-fluff voice.",
+    "compassionate": "Use compassionate, emotionally supportive language.",
+})
+
+# Emotional trait sliders (-100..100) mapped to (negative, positive) directions
+_TRAIT_LABELS = MappingProxyType({
+    "happiness": ("sadder", "happier"),
+    "energy": ("more low-energy", "more energetic"),
+    "confidence": ("more tentative", "more confident"),
+    "calmness": ("more tense", "calmer"),
+    "optimism": ("more cautious", "more optimistic"),
+    "socialness": ("more reserved", "more social"),
+    "empathy": ("more detached", "more empathic"),
+    "curiosity": ("less exploratory", "more curious"),
+    "creativity": ("more literal", "more creative"),
+    "patience": ("more brisk", "more patient"),
+})
+
+# Relative weight of each emotional trait when ranking voice directives
+_TRAIT_WEIGHTS = MappingProxyType({
+    "happiness": 1.1,
+    "energy": 1.0,
+    "confidence": 1.2,
+    "calmness": 1.25,
+    "optimism": 1.05,
+    "socialness": 0.9,
+    "empathy": 1.35,
+    "curiosity": 0.95,
+    "creativity": 0.9,
+    "patience": 1.15,
+})
+
+# Fixed voice/tool guidance that opens every prompt. Built once at import so
+# all Kwamis share the same byte-identical prefix for provider prompt caching.
+_VOICE_GUIDANCE = "\n".join((
+    # Voice interaction guidance
+    "You are interacting via voice. Keep responses concise and conversational.",
+    "Do not use emojis, asterisks, markdown, or other special characters.",
+    "Speak naturally as if having a real conversation.",
+    "When the user asks you to control the app workspace or interface, prefer the available client workspace tools instead of telling them what to click.",
+    "Use the structured client UI tools for requests like opening panels, changing theme settings, modifying avatar parameters, adjusting scene controls, changing voice settings, tuning enhancements, clearing search results, or checking workspace status.",
+    "Prefer set_ui_control as the default tool for free-form interface requests because it gives you one consistent path for domain, control, and value.",
+    "For visible UI changes, briefly say what action you are taking. If a request is ambiguous, ask a clarifying question instead of guessing.",
+    "Do not change lasting workspace preferences unless the user clearly asks. If a tool requires confirmation, wait for that result before continuing.",
+    "If you are unsure which structured UI control to use, call list_ui_controls first to inspect the supported control names and domains.",
+    "Examples: if the user says 'make it darker', use set_ui_control with domain='theme', control='mode', value='dark'. "
+    "If they say 'move the sidebar right', use domain='theme', control='sidebarPosition', value='right'. "
+    "If they say 'open memory', use domain='workspace', control='openPanel', value='memory'. "
+    "If they say 'make the blob spikier', use domain='avatar', control='blobSpikes' with a modest increase to x, y, and z values. "
+    "If they say 'switch to particles face', use domain='avatar', control='renderer', value='particles-face'. "
+    "If they say 'speak a bit faster', use domain='voice', control='ttsSpeed', value set slightly above the current speed.",
+
+    # User relationship guidance
+    "\nWhen users share their name, remember it and use it naturally in conversation.",
+    "Be genuinely interested in learning about who you're talking to.",
+
+    # Voice switching capability
+    "\nYou can change your voice or the AI model being used if the user requests it.",
+    # Search and product discovery
+    "\nWhen the user asks to find products, gifts, or things to buy (e.g. bags, clothes, items), use the product_search tool first so they see actual product cards with product image, name, and price—not store website links. If product_search says it is not configured, use web_search with search_for_products=True instead.",
+    "Remember what the user searched for; use your memory of past searches in follow-up answers.",
+    "If the user says to discard, remove, or dismiss a result (e.g. 'discard the first one', 'remove that card'), call dismiss_search_result with the 0-based index (first card = 0, second = 1).",
+    "If the user wants more like a specific result (e.g. 'find more like this', 'similar to that one'), run web_search with a query like 'similar to [that result title] buy' or 'products like [title]' and set search_for_products=True.",
+
+    # Navigation guidance
+    "\nYou can browse the web for the user. Use navigate_to to open a website. "
+    "The page opens in a live browser panel embedded in the app. The user sees "
+    "everything you do in real time. Use read_navigation_page to see page content and interactive elements, then "
+    "click_in_navigation to click elements (prefer element_id like 'el-5'), "
+    "type_in_navigation to type text, press_key_in_navigation for keys like Enter, "
+    "and scroll_navigation to scroll. Describe what you see and what you're doing so the user can follow along.",
+    "ADVANCED NAVIGATION STRATEGIES:\n"
+    "1. DIRECT SEARCHING: If the user asks you to search for something on a major site (YouTube, Google, Amazon, etc.), "
+    "DO NOT try to navigate to the homepage and click the search bar. Instead, navigate DIRECTLY to the search URL. "
+    "Example: for YouTube, use navigate_to('https://www.youtube.com/results?search_query=song+name').\n"
+    "2. COMPLEX DOMs: Modern sites (like YouTube) hide elements inside Shadow DOMs that read_navigation_page cannot see. "
+    "If you cannot find the element you need to click, use the run_js_in_navigation tool to execute JavaScript directly "
+    "to find and click the element (e.g., `document.querySelector('ytd-video-renderer a#video-title').click()`).\n"
+    "Use close_navigation when done.",
+))
+
+
+# Soul prompt followed by the memory section, filled with a single %-format.
+# The memory context must stay last: everything before it is byte-identical
+# for a given soul, so provider prompt caching can reuse that prefix.
+_MEMORY_PROMPT_FORMAT = (
+    "%s\n\n\n## Your Memory\n\n"
+    "You have persistent memory of past conversations with this user.\n"
+    "Use this context to provide personalized responses:\n\n"
+    "%s"
+)
+
+
+# Attributes that may hold a message's text, in lookup order. livekit's
+# ChatMessage keeps a list in `content` and exposes its text as `text_content`.
+_MESSAGE_TEXT_ATTRS = ("content", "text", "message", "text_content")
+
+# Picks a user's name out of a memory fact like "User's name is Alex"
+_FACT_NAME_PATTERN = re.compile(r"(?:name is|called|i'm|i am)\s+([A-Z][a-z]+)", re.IGNORECASE)
+
+
+def _soul_cache_key(soul: Any) -> tuple:
+    """Build a hashable key from every soul field that affects the prompt text."""
+    return (
+        soul.system_prompt,
+        soul.name,
+        soul.personality,
+        tuple(soul.traits or ()),
+        soul.conversation_style,
+        soul.response_length,
+        soul.emotional_tone,
+        tuple(sorted((str(k), repr(v)) for k, v in (soul.emotional_traits or {}).items())),
+    )
 
 
 class KwamiAgent(Agent, AgentToolsMixin):
@@ -25,6 +158,23 @@ class KwamiAgent(Agent, AgentToolsMixin):
     - Dynamic reconfiguration without disconnection
     """
 
+    # Per-session attributes owned by this class. The LiveKit base class keeps
+    # a __dict__ for its own state, so only Kwami's fields live in slots.
+    __slots__ = (
+        "kwami_config",
+        "_memory",
+        "_skip_greeting",
+        "_last_memory_context",
+        "_current_voice_config",
+        "room",
+        "usage_tracker",
+        "_browser_session",
+        "client_tools",
+    )
+
+    # Soul prompt prefixes shared by every agent in this worker process.
+    _prompt_cache: dict[tuple, str] = {}
+
     def __init__(
         self,
         config: Optional[KwamiConfig] = None,
@@ -34,6 +184,7 @@ class KwamiAgent(Agent, AgentToolsMixin):
         llm: Any = None,
         tts: Any = None,
         skip_greeting: bool = False,
+        instructions: Optional[str] = None,
     ):
         """Initialize the Kwami agent.
         
@@ -45,6 +196,8 @@ class KwamiAgent(Agent, AgentToolsMixin):
             llm: Large Language Model instance.
             tts: Text-to-Speech instance.
             skip_greeting: If True, skip the initial greeting (for reconfigurations).
+            instructions: Prebuilt system prompt to reuse (e.g. from the agent being
+                replaced when the soul is unchanged). Built from config if None.
         """
         self.kwami_config = config or KwamiConfig()
         self._vad = vad
@@ -59,12 +212,17 @@ class KwamiAgent(Agent, AgentToolsMixin):
         self._browser_session = None  # Cloud browser session (lazy-created by navigate_to)
 
         # Initialize client tool manager
-        self.client_tools = ClientToolManager(self)
+        self.client_tools = ClientToolManager(
+            self,
+            batch_tool_calls=self.kwami_config.batch_tool_calls,
+            msgpack_tool_calls=self.kwami_config.msgpack_tool_calls,
+        )
         if self.kwami_config.tools:
             self.client_tools.register_client_tools(self.kwami_config.tools)
         
         # Build system prompt
-        instructions = self._build_system_prompt()
+        if instructions is None:
+            instructions = self._build_system_prompt()
         
         # Get client tools to pass to parent Agent
         combined_tools = self.client_tools.create_client_tools()
@@ -82,91 +240,83 @@ class KwamiAgent(Agent, AgentToolsMixin):
     def _build_system_prompt(self, memory_context: Optional[str] = None) -> str:
         """Build the system prompt from soul configuration and memory context.
         
+        The soul-derived prefix is memoized and the memory section is filled
+        into a precompiled format string, so a rebuild is a single % operation.
+        
         Args:
             memory_context: Optional memory context to inject into the prompt.
             
         Returns:
             Complete system prompt string.
         """
+        base_prompt = self._build_soul_prompt()
+        if not memory_context:
+            return base_prompt
+
+        return _MEMORY_PROMPT_FORMAT % (
+            base_prompt,
+            memory_context[:MAX_SYSTEM_MEMORY_CONTEXT_CHARS],
+        )
+
+    def _build_soul_prompt(self) -> str:
+        """Build (or reuse) the memory-independent part of the system prompt.
+        
+        Returns:
+            The fixed voice/tool guidance followed by soul-specific guidance.
+        """
         soul = self.kwami_config.soul
-        prompt_parts = []
+        cache_key = _soul_cache_key(soul)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Ordered from most to least stable so edits to the persona keep the
+        # shared guidance prefix cacheable: fixed guidance, then tone, then soul.
+        buf = io.StringIO()
+        write = buf.write
+        write(_VOICE_GUIDANCE)
+
+        # Response length guidance
+        length_guide = _LENGTH_GUIDE.get(soul.response_length)
+        if length_guide:
+            write("\n\n")
+            write(length_guide)
+
+        # Emotional tone guidance
+        tone_guide = _TONE_GUIDE.get(soul.emotional_tone)
+        if tone_guide:
+            write("\n\n")
+            write(tone_guide)
 
         # Base personality
-        if soul.system_prompt:
-            prompt_parts.append(soul.system_prompt)
-        else:
-            prompt_parts.append(f"You are {soul.name}, {soul.personality}.")
+        write("\n\n")
+        write(soul.system_prompt or f"You are {soul.name}, {soul.personality}.")
 
         # Traits
         if soul.traits:
-            prompt_parts.append(f"\nKey traits: {', '.join(soul.traits)}")
+            write("\n\nKey traits: ")
+            write(", ".join(soul.traits))
 
         # Conversation style
         if soul.conversation_style:
-            prompt_parts.append(f"\nConversation style: {soul.conversation_style}")
-
-        # Response length guidance
-        length_guide = {
-            "short": "Keep responses brief and concise (1-2 sentences).",
-            "medium": "Provide balanced responses with enough detail (2-4 sentences).",
-            "long": "Give comprehensive, detailed responses when appropriate.",
-        }
-        if soul.response_length in length_guide:
-            prompt_parts.append(f"\n{length_guide[soul.response_length]}")
-
-        # Emotional tone guidance
-        tone_guide = {
-            "neutral": "Maintain a balanced, objective tone.",
-            "warm": "Express warmth and friendliness in your interactions.",
-            "enthusiastic": "Show enthusiasm and energy in your responses.",
-            "calm": "Maintain a calm, soothing demeanor.",
-            "playful": "Use a light, playful voice while staying helpful.",
-            "confident": "Speak with confident, decisive language.",
-            "serious": "Use a serious, focused, no-fluff voice.",
-            "compassionate": "Use compassionate, emotionally supportive language.",
-        }
-        if soul.emotional_tone in tone_guide:
-            prompt_parts.append(f"\n{tone_guide[soul.emotional_tone]}")
+            write("\n\nConversation style: ")
+            write(soul.conversation_style)
 
         # Emotional trait sliders (-100..100) mapped to conversational guidance
         if soul.emotional_traits:
-            trait_labels = {
-                "happiness": ("sadder", "happier"),
-                "energy": ("more low-energy", "more energetic"),
-                "confidence": ("more tentative", "more confident"),
-                "calmness": ("more tense", "calmer"),
-                "optimism": ("more cautious", "more optimistic"),
-                "socialness": ("more reserved", "more social"),
-                "empathy": ("more detached", "more empathic"),
-                "curiosity": ("less exploratory", "more curious"),
-                "creativity": ("more literal", "more creative"),
-                "patience": ("more brisk", "more patient"),
-            }
-            trait_weights = {
-                "happiness": 1.1,
-                "energy": 1.0,
-                "confidence": 1.2,
-                "calmness": 1.25,
-                "optimism": 1.05,
-                "socialness": 0.9,
-                "empathy": 1.35,
-                "curiosity": 0.95,
-                "creativity": 0.9,
-                "patience": 1.15,
-            }
             weighted_traits = []
             for key, value in soul.emotional_traits.items():
-                if key not in trait_labels:
+                if key not in _TRAIT_LABELS:
                     continue
                 try:
                     score = float(value)
                 except (TypeError, ValueError):
                     continue
-                weighted_score = score * trait_weights.get(key, 1.0)
+                weighted_score = score * _TRAIT_WEIGHTS.get(key, 1.0)
                 magnitude = min(100.0, abs(weighted_score))
                 if magnitude < 10:
                     continue
-                low_label, high_label = trait_labels[key]
+                low_label, high_label = _TRAIT_LABELS[key]
                 direction = high_label if weighted_score > 0 else low_label
                 if magnitude < 35:
                     strength = "slightly"
@@ -181,101 +331,15 @@ class KwamiAgent(Agent, AgentToolsMixin):
             if weighted_traits:
                 weighted_traits.sort(key=lambda item: item[0], reverse=True)
                 directives = [directive for _, directive in weighted_traits[:5]]
-                prompt_parts.append(
-                    "\nVoice emotion profile: "
-                    + ", ".join(directives)
-                    + ". Keep this consistent without sounding exaggerated."
-                )
+                write("\n\nVoice emotion profile: ")
+                write(", ".join(directives))
+                write(". Keep this consistent without sounding exaggerated.")
 
-        # Voice interaction guidance
-        prompt_parts.append(
-            "\n\nYou are interacting via voice. Keep responses concise and conversational."
-        )
-        prompt_parts.append(
-            "Do not use emojis, asterisks, markdown, or other special characters."
-        )
-        prompt_parts.append("Speak naturally as if having a real conversation.")
-        prompt_parts.append(
-            "When the user asks you to control the app workspace or interface, prefer the available client workspace tools instead of telling them what to click."
-        )
-        prompt_parts.append(
-            "Use the structured client UI tools for requests like opening panels, changing theme settings, modifying avatar parameters, adjusting scene controls, changing voice settings, tuning enhancements, clearing search results, or checking workspace status."
-        )
-        prompt_parts.append(
-            "Prefer set_ui_control as the default tool for free-form interface requests because it gives you one consistent path for domain, control, and value."
-        )
-        prompt_parts.append(
-            "For visible UI changes, briefly say what action you are taking. If a request is ambiguous, ask a clarifying question instead of guessing."
-        )
-        prompt_parts.append(
-            "Do not change lasting workspace preferences unless the user clearly asks. If a tool requires confirmation, wait for that result before continuing."
-        )
-        prompt_parts.append(
-            "If you are unsure which structured UI control to use, call list_ui_controls first to inspect the supported control names and domains."
-        )
-        prompt_parts.append(
-            "Examples: if the user says 'make it darker', use set_ui_control with domain='theme', control='mode', value='dark'. "
-            "If they say 'move the sidebar right', use domain='theme', control='sidebarPosition', value='right'. "
-            "If they say 'open memory', use domain='workspace', control='openPanel', value='memory'. "
-            "If they say 'make the blob spikier', use domain='avatar', control='blobSpikes' with a modest increase to x, y, and z values. "
-            "If they say 'switch to particles face', use domain='avatar', control='renderer', value='particles-face'. "
-            "If they say 'speak a bit faster', use domain='voice', control='ttsSpeed', value set slightly above the current speed."
-        )
-        
-        # User relationship guidance
-        prompt_parts.append(
-            "\nWhen users share their name, remember it and use it naturally in conversation."
-        )
-        prompt_parts.append("Be genuinely interested in learning about who you're talking to.")
-        
-        # Voice switching capability
-        prompt_parts.append(
-            "\nYou can change your voice or the AI model being used if the user requests it."
-        )
-        # Search and product discovery
-        prompt_parts.append(
-            "\nWhen the user asks to find products, gifts, or things to buy (e.g. bags, clothes, items), use the product_search tool first so they see actual product cards with product image, name, and price—not store website links. If product_search says it is not configured, use web_search with search_for_products=True instead."
-        )
-        prompt_parts.append(
-            "Remember what the user searched for; use your memory of past searches in follow-up answers."
-        )
-        prompt_parts.append(
-            "If the user says to discard, remove, or dismiss a result (e.g. 'discard the first one', 'remove that card'), call dismiss_search_result with the 0-based index (first card = 0, second = 1)."
-        )
-        prompt_parts.append(
-            "If the user wants more like a specific result (e.g. 'find more like this', 'similar to that one'), run web_search with a query like 'similar to [that result title] buy' or 'products like [title]' and set search_for_products=True."
-        )
-
-        # Navigation guidance
-        prompt_parts.append(
-            "\nYou can browse the web for the user. Use navigate_to to open a website. "
-            "The page opens in a live browser panel embedded in the app. The user sees "
-            "everything you do in real time. Use read_navigation_page to see page content and interactive elements, then "
-            "click_in_navigation to click elements (prefer element_id like 'el-5'), "
-            "type_in_navigation to type text, press_key_in_navigation for keys like Enter, "
-            "and scroll_navigation to scroll. Describe what you see and what you're doing so the user can follow along."
-        )
-        prompt_parts.append(
-            "ADVANCED NAVIGATION STRATEGIES:\n"
-            "1. DIRECT SEARCHING: If the user asks you to search for something on a major site (YouTube, Google, Amazon, etc.), "
-            "DO NOT try to navigate to the homepage and click the search bar. Instead, navigate DIRECTLY to the search URL. "
-            "Example: for YouTube, use navigate_to('https://www.youtube.com/results?search_query=song+name').\n"
-            "2. COMPLEX DOMs: Modern sites (like YouTube) hide elements inside Shadow DOMs that read_navigation_page cannot see. "
-            "If you cannot find the element you need to click, use the run_js_in_navigation tool to execute JavaScript directly "
-            "to find and click the element (e.g., `document.querySelector('ytd-video-renderer a#video-title').click()`).\n"
-            "Use close_navigation when done."
-        )
-
-        # Memory context injection
-        if memory_context:
-            prompt_parts.append("\n\n## Your Memory\n")
-            prompt_parts.append(
-                "You have persistent memory of past conversations with this user."
-            )
-            prompt_parts.append("Use this context to provide personalized responses:\n")
-            prompt_parts.append(memory_context[:MAX_SYSTEM_MEMORY_CONTEXT_CHARS])
-
-        return "\n".join(prompt_parts)
+        prompt = buf.getvalue()
+        if len(self._prompt_cache) >= MAX_PROMPT_CACHE_ENTRIES:
+            self._prompt_cache.clear()
+        self._prompt_cache[cache_key] = prompt
+        return prompt
 
     async def _inject_memory_context(self) -> None:
         """Fetch memory context, cache user name, and update system prompt.
@@ -283,27 +347,30 @@ class KwamiAgent(Agent, AgentToolsMixin):
         Also pre-caches the user name so subsequent messages include
         proper attribution in the knowledge graph.
         """
-        if not self._memory or not self._memory.is_initialized:
+        if not self._memory or not await self._memory.wait_until_ready():
             return
 
         try:
             # Pre-cache user name for message attribution
             user_name = await self._memory.get_user_name()
             if user_name:
-                logger.info(f"Cached user name from memory: {user_name}")
+                logger.info("Cached user name from memory: %s", user_name)
 
             context = await self._memory.get_context()
             memory_text = context.to_system_prompt_addition()
             
             if memory_text:
                 new_instructions = self._build_system_prompt(memory_text)
-                await self.update_instructions(new_instructions)
-                logger.info("Injected memory context into system prompt")
+                # A same-soul rebuild inherits the previous agent's prompt, which
+                # usually already carries this exact memory context
+                if new_instructions != getattr(self, "instructions", None):
+                    await self.update_instructions(new_instructions)
+                    logger.info("Injected memory context into system prompt")
             
             # Store context for greeting use (avoids a second API call)
             self._last_memory_context = context
         except Exception as e:
-            logger.error(f"Failed to inject memory context: {e}")
+            logger.error("Failed to inject memory context: %s", e)
 
     async def on_enter(self, room: Any = None) -> None:
         """Called when the agent joins the room.
@@ -314,12 +381,12 @@ class KwamiAgent(Agent, AgentToolsMixin):
         my_identity = ""
         if room:
             my_identity = room.local_participant.identity if room.local_participant else ""
-            logger.info(f"Agent {my_identity} entering room...")
+            logger.info("Agent %s entering room...", my_identity)
             
             # Quick check for duplicate agents (non-blocking)
             should_disconnect = await should_disconnect_as_duplicate(room, my_identity)
             if should_disconnect:
-                logger.warning(f"Agent {my_identity} disconnecting due to duplicate detection")
+                logger.warning("Agent %s disconnecting due to duplicate detection", my_identity)
                 await room.disconnect()
                 return
         
@@ -327,8 +394,9 @@ class KwamiAgent(Agent, AgentToolsMixin):
         self.room = room
 
         logger.info(
-            f"Kwami agent '{self.kwami_config.kwami_name}' "
-            f"({self.kwami_config.kwami_id}) entered room successfully"
+            "Kwami agent '%s' (%s) entered room successfully",
+            self.kwami_config.kwami_name,
+            self.kwami_config.kwami_id,
         )
 
         # Inject memory context into system prompt
@@ -348,7 +416,7 @@ class KwamiAgent(Agent, AgentToolsMixin):
                 allow_interruptions=True,
             )
         except Exception as e:
-            logger.error(f"Failed to generate greeting: {e}")
+            logger.error("Failed to generate greeting: %s", e)
             # Fall back to a simple greeting so the agent still speaks
             try:
                 self.session.generate_reply(
@@ -391,8 +459,9 @@ class KwamiAgent(Agent, AgentToolsMixin):
                 if context.recent_messages or context.facts or context.context_block:
                     is_returning_user = True
                     logger.debug(
-                        f"Returning user detected "
-                        f"(messages: {len(context.recent_messages)}, facts: {len(context.facts)})"
+                        "Returning user detected (messages: %d, facts: %d)",
+                        len(context.recent_messages),
+                        len(context.facts),
                     )
                     
                     # Extract recent topics from context block or summary
@@ -411,23 +480,19 @@ class KwamiAgent(Agent, AgentToolsMixin):
                 
                 # If name not cached, try extracting from facts as fallback
                 if not user_name and context and context.facts:
-                    import re
                     for fact in context.facts:
-                        match = re.search(
-                            r"(?:name is|called|i'm|i am)\s+([A-Z][a-z]+)",
-                            fact, re.IGNORECASE
-                        )
+                        match = _FACT_NAME_PATTERN.search(fact)
                         if match:
                             potential = match.group(1).capitalize()
                             excluded = {'the', 'a', 'user', 'assistant', 'kwami', agent_name.lower()}
                             if potential.lower() not in excluded:
                                 user_name = potential
                                 self._memory.set_user_name(user_name)
-                                logger.info(f"Found user name from facts: {user_name}")
+                                logger.info("Found user name from facts: %s", user_name)
                                 break
                                 
             except Exception as e:
-                logger.warning(f"Could not extract user info from memory: {e}")
+                logger.warning("Could not extract user info from memory: %s", e)
         
         # Build natural greeting instructions based on what we know
         if user_name:
@@ -491,7 +556,7 @@ class KwamiAgent(Agent, AgentToolsMixin):
                     user_name = self._memory._cached_user_name or None
                     await self._memory.buffer_user_message(content, name=user_name)
             except Exception as e:
-                logger.warning(f"Failed to buffer user message: {e}")
+                logger.warning("Failed to buffer user message: %s", e)
 
     async def on_agent_turn_completed(self, turn_ctx: Any, new_message: Any) -> None:
         """Called when agent finishes responding.
@@ -518,7 +583,7 @@ class KwamiAgent(Agent, AgentToolsMixin):
                         assistant_name=agent_name,
                     )
             except Exception as e:
-                logger.warning(f"Failed to add exchange to memory: {e}")
+                logger.warning("Failed to add exchange to memory: %s", e)
 
     def _extract_message_content(self, message: Any) -> str:
         """Extract text content from various message formats.
@@ -532,21 +597,29 @@ class KwamiAgent(Agent, AgentToolsMixin):
         if message is None:
             return ""
         
-        # Try common content attributes
-        for attr in ("content", "text", "message"):
-            if hasattr(message, attr):
-                value = getattr(message, attr)
-                if value is not None and isinstance(value, str) and value.strip():
-                    return value.strip()
-        
         # If message is already a string
         if isinstance(message, str):
             return message.strip()
         
+        # Try common text attributes (single lookup each, no hasattr probe)
+        for attr in _MESSAGE_TEXT_ATTRS:
+            value = getattr(message, attr, None)
+            if isinstance(value, str):
+                value = value.strip()
+                if value:
+                    return value
+        
+        # Types using the default object repr can only produce "<... at 0x...>",
+        # so skip building that string altogether
+        message_type = type(message)
+        if message_type.__str__ is object.__str__ and message_type.__repr__ is object.__repr__:
+            logger.debug("Could not extract content from message type: %s", message_type)
+            return ""
+        
         # Last resort: stringify but filter out object representations
         text = str(message)
         if text.startswith("<") and text.endswith(">"):
-            logger.debug(f"Could not extract content from message type: {type(message)}")
+            logger.debug("Could not extract content from message type: %s", message_type)
             return ""
         
         return text.strip()
@@ -44,7 +44,7 @@ class KwamiMemoryConfig:
     auto_inject_context: bool = True
     
     # Maximum number of recent messages to include in context
-    max_context_messages: int = 10
+    max_context_messages: int = 5
     
     # Whether to include extracted facts in context
     include_facts: bool = True
@@ -55,6 +55,9 @@ class KwamiMemoryConfig:
     # Minimum relevance score for facts (0.0 - 1.0)
     min_fact_relevance: float = 0.5
     
+    # Seconds a retrieved context is reused before Zep is queried again (0 disables)
+    context_cache_ttl: float = 5.0
+    
     # Whether to configure custom ontology (entity/edge types)
     configure_ontology: bool = True
 
@@ -83,7 +86,7 @@ class KwamiSoulConfig:
     emotional_traits: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class KwamiVoiceConfig:
     """Voice pipeline configuration from the Kwami frontend.
     
@@ -245,6 +248,10 @@ class KwamiConfig:
     voice: KwamiVoiceConfig = field(default_factory=KwamiVoiceConfig)
     memory: KwamiMemoryConfig = field(default_factory=KwamiMemoryConfig)
     tools: list[dict] = field(default_factory=list)
+    # Client understands "tool_calls_batch" envelopes for parallel tool calls
+    batch_tool_calls: bool = False
+    # Client decodes MessagePack tool calls published on "tool_call.mp"
+    msgpack_tool_calls: bool = False
 
     # Backward-compatible alias for clients/modules that still use "persona".
     @property
@@ -8,6 +8,8 @@ This module contains constants for:
 - Configuration Defaults
 """
 
+from types import MappingProxyType
+
 # =============================================================================
 # Providers
 # =============================================================================
@@ -20,7 +22,7 @@ class TTSProviders:
     GOOGLE = "google"
     RIME = "rime"
     
-    ALL = {OPENAI, ELEVENLABS, CARTESIA, DEEPGRAM, GOOGLE, RIME}
+    ALL = frozenset({OPENAI, ELEVENLABS, CARTESIA, DEEPGRAM, GOOGLE, RIME})
 
 
 class STTProviders:
@@ -31,7 +33,7 @@ class STTProviders:
     ELEVENLABS = "elevenlabs"
     CARTESIA = "cartesia"
     
-    ALL = {DEEPGRAM, OPENAI, ASSEMBLYAI, GOOGLE, ELEVENLABS, CARTESIA}
+    ALL = frozenset({DEEPGRAM, OPENAI, ASSEMBLYAI, GOOGLE, ELEVENLABS, CARTESIA})
 
 
 class LLMProviders:
@@ -44,7 +46,7 @@ class LLMProviders:
     CEREBRAS = "cerebras"
     OLLAMA = "ollama"
     
-    ALL = {OPENAI, GOOGLE, ANTHROPIC, GROQ, DEEPSEEK, MISTRAL, CEREBRAS, OLLAMA}
+    ALL = frozenset({OPENAI, GOOGLE, ANTHROPIC, GROQ, DEEPSEEK, MISTRAL, CEREBRAS, OLLAMA})
 
 
 # =============================================================================
@@ -67,8 +69,9 @@ class OpenAIVoices:
     BALLAD = "ballad"
     VERSE = "verse"
     
-    ALL = {ALLOY, ASH, CORAL, ECHO, FABLE, NOVA, ONYX, SAGE, SHIMMER, BALLAD, VERSE}
-    STANDARD = {ALLOY, ASH, CORAL, ECHO, FABLE, NOVA, ONYX, SAGE, SHIMMER}
+    ALL = frozenset({ALLOY, ASH, CORAL, ECHO, FABLE, NOVA, ONYX, SAGE, SHIMMER, BALLAD, VERSE})
+    STANDARD = frozenset({ALLOY, ASH, CORAL, ECHO, FABLE, NOVA, ONYX, SAGE, SHIMMER})
+    STANDARD_LIST = ", ".join(sorted(STANDARD))  # For log/error messages
     DEFAULT = NOVA
 
 
@@ -95,9 +98,9 @@ class ElevenLabsVoices:
     CHRIS = "iP95p4xoKVk53GoZ742B"
     BRIAN = "nPczCjzI2devNBz1zQrb"
     
-    ALL = {RACHEL, DOMI, BELLA, ELLI, JOSH, ARNOLD, ADAM, SAM, DANIEL,
-           CHARLOTTE, LILY, CALLUM, CHARLIE, GEORGE, LIAM, WILL,
-           JESSICA, ERIC, CHRIS, BRIAN}
+    ALL = frozenset({RACHEL, DOMI, BELLA, ELLI, JOSH, ARNOLD, ADAM, SAM, DANIEL,
+                     CHARLOTTE, LILY, CALLUM, CHARLIE, GEORGE, LIAM, WILL,
+                     JESSICA, ERIC, CHRIS, BRIAN})
     DEFAULT = RACHEL
 
 
@@ -121,7 +124,7 @@ class CartesiaVoices:
     BRITISH_NARRATOR = "2ee87190-8f84-4925-97da-e52547f9462c"
     
     # Friendly Name Mapping
-    NAME_MAP = {
+    NAME_MAP = MappingProxyType({
         "british lady": BRITISH_LADY,
         "sophia": BRITISH_LADY,
         "california girl": CALIFORNIA_GIRL,
@@ -130,7 +133,7 @@ class CartesiaVoices:
         "blake": NEWSMAN,
         "commercial man": COMMERCIAL_MAN,
         "friendly sidekick": FRIENDLY_SIDEKICK,
-    }
+    })
     
     DEFAULT = BRITISH_LADY
 
@@ -152,9 +155,12 @@ class DeepgramVoices:
     HELIOS = "helios"
     ZEUS = "zeus"
     
-    ALL = {ASTERIA, LUNA, STELLA, ATHENA, HERA, ORION, ARCAS, 
-           PERSEUS, ANGUS, ORPHEUS, HELIOS, ZEUS}
+    ALL = frozenset({ASTERIA, LUNA, STELLA, ATHENA, HERA, ORION, ARCAS,
+                     PERSEUS, ANGUS, ORPHEUS, HELIOS, ZEUS})
+    ALL_LIST = ", ".join(sorted(ALL))  # For log/error messages
     DEFAULT = ASTERIA
+    # Aura model ID for each voice (e.g., "asteria" -> "aura-asteria-en")
+    MODEL_FOR = MappingProxyType({v: f"aura-{v}-en" for v in ALL})
 
 
 class GoogleVoices:
@@ -189,7 +195,8 @@ class OpenAIModels:
     GPT_4O = "gpt-4o"
     GPT_4O_MINI = "gpt-4o-mini"
     
-    ALL_TTS = {TTS_1, TTS_1_HD, GPT_4O_MINI_TTS}
+    ALL_TTS = frozenset({TTS_1, TTS_1_HD, GPT_4O_MINI_TTS})
+    ALL_TTS_LIST = ", ".join(sorted(ALL_TTS))  # For log/error messages
 
 
 class DeepgramModels:
@@ -219,14 +226,14 @@ class EnvVars:
 # Misc Constants
 # =============================================================================
 
-LANGUAGE_GREETINGS = {
+LANGUAGE_GREETINGS = MappingProxyType({
     "en": "Language changed to English. How can I help you?",
-    "es": "Idioma cambiado a espanol. Como puedo ayudarte?",
-    "fr": "Langue changee en francais. Comment puis-je vous aider?",
+    "es": "Idioma cambiado a español. ¿Cómo puedo ayudarte?",
+    "fr": "Langue changée en français. Comment puis-je vous aider ?",
     "de": "Sprache auf Deutsch geändert. Wie kann ich Ihnen helfen?",
     "it": "Lingua cambiata in italiano. Come posso aiutarti?",
-    "pt": "Idioma alterado para portugues. Como posso ajuda-lo?",
-    "ja": "Language changed to Japanese. How can I help you?",
-    "ko": "Language changed to Korean. How can I help you?",
-    "zh": "Language changed to Chinese. How can I help you?",
-}
+    "pt": "Idioma alterado para português. Como posso ajudá-lo?",
+    "ja": "言語を日本語に変更しました。何かお手伝いできることはありますか？",
+    "ko": "언어가 한국어로 변경되었습니다. 무엇을 도와드릴까요?",
+    "zh": "语言已切换为中文。有什么可以帮您的吗？",
+})
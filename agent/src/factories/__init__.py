@@ -1,13 +1,29 @@
-"""Factory functions for creating voice pipeline components."""
+"""Factory functions for creating voice pipeline components.
 
-from .llm import create_llm
+VAD models are stateless and cached per parameter set. STT, LLM and TTS
+instances hold per-session connections, are reconfigured in place via
+update_options and are closed when their agent is replaced, so each call
+builds a new one; reuse happens by handing instances from one agent to the
+next (see warmup_pipeline and the config handler) rather than by caching.
+
+Provider plugins are imported when these modules load, not lazily per
+provider: livekit registers each plugin when it is imported and requires that
+to happen on the main thread during worker startup (it is also how
+`download-files` discovers them). Optional plugins that are not installed
+degrade to None instead.
+"""
+
+from .llm import create_llm, resolve_llm_temperature
 from .stt import create_stt
 from .tts import create_tts
 from .realtime import create_realtime_model
+from .warmup import warmup_pipeline
 
 __all__ = [
     "create_llm",
+    "resolve_llm_temperature",
     "create_stt",
     "create_tts",
     "create_realtime_model",
+    "warmup_pipeline",
 ]
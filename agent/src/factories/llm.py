@@ -11,6 +11,17 @@ from ..utils.provider import strip_model_prefix
 # OpenAI models that only support temperature=1 (default); others support 0..2
 _OPENAI_TEMPERATURE_FIXED_MODELS = ("gpt-5.1", "o1-", "o3-")
 
+# Providers served through the OpenAI plugin's compatible-API constructors:
+# provider -> (openai.LLM factory method, default model, extra kwargs)
+_OPENAI_COMPATIBLE_LLMS = {
+    "anthropic": ("with_anthropic", "claude-3-5-sonnet-latest", {}),
+    "groq": ("with_groq", "llama-3.1-70b-versatile", {}),
+    "deepseek": ("with_deepseek", "deepseek-chat", {}),
+    "mistral": ("with_x_ai", "mistral-large-latest", {"base_url": "https://api.mistral.ai/v1"}),
+    "cerebras": ("with_cerebras", "llama3.1-70b", {}),
+    "ollama": ("with_ollama", "llama3.2", {}),
+}
+
 
 def _openai_temperature(config: KwamiVoiceConfig, model: str) -> float:
     """Use temperature=1 for models that only support the default (avoids API 400)."""
@@ -22,6 +33,14 @@ def _openai_temperature(config: KwamiVoiceConfig, model: str) -> float:
     return config.llm_temperature
 
 
+def resolve_llm_temperature(config: KwamiVoiceConfig) -> float:
+    """Return the temperature create_llm would use for this configuration."""
+    provider = config.llm_provider.lower()
+    if provider == "openai":
+        return _openai_temperature(config, strip_model_prefix(config.llm_model or "", provider))
+    return config.llm_temperature
+
+
 def create_llm(config: KwamiVoiceConfig):
     """Create LLM instance based on configuration."""
     provider = config.llm_provider.lower()
@@ -44,53 +63,19 @@ def create_llm(config: KwamiVoiceConfig):
                 temperature=temp,
             )
     
-    elif provider == "google" and google is not None:
+    if provider == "google" and google is not None:
         return google.LLM(
             model=model or "gemini-2.0-flash",
             temperature=config.llm_temperature,
         )
     
-    elif provider == "anthropic":
-        # Anthropic via OpenAI-compatible API
-        return openai.LLM.with_anthropic(
-            model=model or "claude-3-5-sonnet-latest",
-            temperature=config.llm_temperature,
-        )
-    
-    elif provider == "groq":
-        # Groq via OpenAI-compatible API
-        return openai.LLM.with_groq(
-            model=model or "llama-3.1-70b-versatile",
-            temperature=config.llm_temperature,
-        )
-    
-    elif provider == "deepseek":
-        # DeepSeek via OpenAI-compatible API
-        return openai.LLM.with_deepseek(
-            model=model or "deepseek-chat",
-            temperature=config.llm_temperature,
-        )
-    
-    elif provider == "mistral":
-        # Mistral via OpenAI-compatible API  
-        return openai.LLM.with_x_ai(
-            model=model or "mistral-large-latest",
-            temperature=config.llm_temperature,
-            base_url="https://api.mistral.ai/v1",
-        )
-    
-    elif provider == "cerebras":
-        # Cerebras via OpenAI-compatible API
-        return openai.LLM.with_cerebras(
-            model=model or "llama3.1-70b",
-            temperature=config.llm_temperature,
-        )
-    
-    elif provider == "ollama":
-        # Ollama local models
-        return openai.LLM.with_ollama(
-            model=model or "llama3.2",
+    compatible = _OPENAI_COMPATIBLE_LLMS.get(provider)
+    if compatible is not None:
+        factory_name, default_model, extra_kwargs = compatible
+        return getattr(openai.LLM, factory_name)(
+            model=model or default_model,
             temperature=config.llm_temperature,
+            **extra_kwargs,
         )
     
     # Default to OpenAI
@@ -1,3 +1,5 @@
+import functools
+
 from livekit.plugins import openai
 
 try:
@@ -9,6 +11,16 @@ from ..config import KwamiVoiceConfig
 from ..utils.provider import strip_model_prefix
 
 
+@functools.lru_cache(maxsize=16)
+def _server_vad_options(threshold: float, silence_duration_ms: int):
+    """Build server VAD options once per parameter set (they are never mutated)."""
+    return openai.realtime.ServerVadOptions(
+        threshold=threshold,
+        prefix_padding_ms=300,
+        silence_duration_ms=silence_duration_ms,
+    )
+
+
 def create_realtime_model(config: KwamiVoiceConfig):
     """Create Realtime model instance for ultra-low latency."""
     provider = config.realtime_provider.lower() if config.realtime_provider else "openai"
@@ -22,10 +34,8 @@ def create_realtime_model(config: KwamiVoiceConfig):
             voice=config.realtime_voice or "alloy",
             temperature=config.llm_temperature,
             modalities=config.realtime_modalities or ["text", "audio"],
-            turn_detection=openai.realtime.ServerVadOptions(
-                threshold=config.vad_threshold,
-                prefix_padding_ms=300,
-                silence_duration_ms=int(config.vad_min_silence_duration * 1000),
+            turn_detection=_server_vad_options(
+                config.vad_threshold, int(config.vad_min_silence_duration * 1000)
             ),
         )
     
@@ -8,6 +8,7 @@ Provides comprehensive TTS creation with:
 - Caching support
 """
 
+import functools
 import os
 from typing import Optional
 
@@ -37,7 +38,7 @@ from ..constants import (
     EnvVars,
 )
 from ..exceptions import VoiceProviderError, ConfigurationError
-from ..utils.provider import strip_model_prefix
+from ..utils.provider import resolve_cartesia_voice, strip_model_prefix
 
 logger = get_logger("tts")
 
@@ -46,27 +47,33 @@ logger = get_logger("tts")
 # API Key Validation
 # =============================================================================
 
+_KEY_MAP = {
+    TTSProviders.OPENAI: EnvVars.OPENAI,
+    TTSProviders.ELEVENLABS: EnvVars.ELEVENLABS,
+    TTSProviders.CARTESIA: EnvVars.CARTESIA,
+    TTSProviders.DEEPGRAM: EnvVars.DEEPGRAM,
+    TTSProviders.GOOGLE: EnvVars.GOOGLE,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _keyed_providers() -> frozenset[str]:
+    """Probe the environment once for providers that have an API key set.
+    
+    Probed lazily rather than at import so it runs after main loads .env.
+    """
+    return frozenset(
+        provider for provider, env_vars in _KEY_MAP.items()
+        if any(os.getenv(env_var) for env_var in env_vars)
+    )
+
+
 def _check_api_key(provider: str) -> bool:
     """Check if the required API key is set for a provider."""
-    key_map = {
-        TTSProviders.OPENAI: EnvVars.OPENAI,
-        TTSProviders.ELEVENLABS: EnvVars.ELEVENLABS,
-        TTSProviders.CARTESIA: EnvVars.CARTESIA,
-        TTSProviders.DEEPGRAM: EnvVars.DEEPGRAM,
-        TTSProviders.GOOGLE: EnvVars.GOOGLE,
-    }
-    env_vars = key_map.get(provider, [])
-    if not env_vars:
-        return True  # Unknown provider, assume OK
-    
-    # Check if any of the valid env vars are set
-    for env_var in env_vars:
-        if os.getenv(env_var):
-            return True
+    if provider not in _KEY_MAP or provider in _keyed_providers():
+        return True  # Unknown providers are assumed OK
     
-    # Check for plural constants list just in case
-    
-    logger.warning(f"⚠️ {' or '.join(env_vars)} not set for {provider} TTS")
+    logger.warning(f"⚠️ {' or '.join(_KEY_MAP[provider])} not set for {provider} TTS")
     return False
 
 
@@ -137,7 +144,7 @@ def _create_openai_tts(config: KwamiVoiceConfig):
     if model not in OpenAIModels.ALL_TTS:
         logger.warning(
             f"Model '{model}' not supported by OpenAI TTS. "
-            f"Using '{OpenAIModels.TTS_1}'. Valid: {', '.join(sorted(OpenAIModels.ALL_TTS))}"
+            f"Using '{OpenAIModels.TTS_1}'. Valid: {OpenAIModels.ALL_TTS_LIST}"
         )
         model = OpenAIModels.TTS_1
     
@@ -146,7 +153,7 @@ def _create_openai_tts(config: KwamiVoiceConfig):
         logger.warning(
             f"Voice '{voice}' not supported by OpenAI TTS. "
             f"Using '{OpenAIVoices.DEFAULT}'. "
-            f"Valid: {', '.join(sorted(OpenAIVoices.STANDARD))}"
+            f"Valid: {OpenAIVoices.STANDARD_LIST}"
         )
         voice = OpenAIVoices.DEFAULT
     
@@ -214,8 +221,7 @@ def _create_cartesia_tts(config: KwamiVoiceConfig):
     voice = config.tts_voice or CartesiaVoices.DEFAULT
     
     # Check for friendly name mapping
-    if voice.lower() in CartesiaVoices.NAME_MAP:
-        voice = CartesiaVoices.NAME_MAP[voice.lower()]
+    voice = resolve_cartesia_voice(voice)
     
     # Cartesia uses UUID format voice IDs
     if voice and len(voice) < 30 and "-" not in voice:
@@ -243,12 +249,15 @@ def _create_deepgram_tts(config: KwamiVoiceConfig):
         logger.warning(
             f"Voice '{voice}' not in known Deepgram voices. "
             f"Using '{DeepgramVoices.DEFAULT}'. "
-            f"Valid: {', '.join(sorted(DeepgramVoices.ALL))}"
+            f"Valid: {DeepgramVoices.ALL_LIST}"
         )
         voice = DeepgramVoices.DEFAULT
     
     # Deepgram model includes voice (e.g., "aura-asteria-en")
-    model = strip_model_prefix(config.tts_model or "", "deepgram") or f"aura-{voice}-en"
+    model = (
+        strip_model_prefix(config.tts_model or "", "deepgram")
+        or DeepgramVoices.MODEL_FOR[voice]
+    )
     
     return deepgram.TTS(model=model)
 
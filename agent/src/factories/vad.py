@@ -1,10 +1,21 @@
+import functools
+
 from livekit.plugins import silero
 from ..config import KwamiVoiceConfig
 
 
+@functools.lru_cache(maxsize=8)
+def _load_silero_vad(min_speech_duration: float, min_silence_duration: float):
+    """Load Silero VAD once per parameter set (instances are shared across streams)."""
+    return silero.VAD.load(
+        min_speech_duration=min_speech_duration,
+        min_silence_duration=min_silence_duration,
+    )
+
+
 def create_vad(config: KwamiVoiceConfig):
     """Create VAD instance based on configuration."""
-    return silero.VAD.load(
-        min_speech_duration=config.vad_min_speech_duration,
-        min_silence_duration=config.vad_min_silence_duration,
+    return _load_silero_vad(
+        round(config.vad_min_speech_duration, 3),
+        round(config.vad_min_silence_duration, 3),
     )
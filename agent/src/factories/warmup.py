@@ -0,0 +1,38 @@
+"""Worker bootstrap warmup for voice pipeline components."""
+
+from typing import Any, Dict, Optional
+
+from ..config import KwamiVoiceConfig
+from ..utils.logging import get_logger
+from .llm import create_llm
+from .stt import create_stt
+from .tts import create_tts
+
+logger = get_logger("warmup")
+
+
+def warmup_pipeline(voice_config: KwamiVoiceConfig) -> Optional[Dict[str, Any]]:
+    """Create the default STT/LLM/TTS so the first agent skips plugin setup.
+    
+    Runs in the worker's prewarm hook, before any room is joined. The components
+    are handed to a single agent and closed when that agent is replaced, so
+    callers must take them out of the process userdata rather than share them.
+    
+    Args:
+        voice_config: Voice configuration to build the components from.
+        
+    Returns:
+        Dict with "stt", "llm" and "tts" instances, or None for realtime
+        pipelines or when a component could not be created.
+    """
+    if voice_config.pipeline_type == "realtime":
+        return None
+    try:
+        return {
+            "stt": create_stt(voice_config),
+            "llm": create_llm(voice_config),
+            "tts": create_tts(voice_config),
+        }
+    except Exception as e:
+        logger.warning("Could not prewarm default voice pipeline: %s", e)
+        return None
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from ..config import KwamiConfig
-from ..memory import create_memory
+from ..constants import OpenAIVoices
+from ..factories import resolve_llm_temperature
+from ..memory import start_memory
 from ..utils.logging import get_logger, log_error
-from ..utils.provider import detect_provider_change, strip_model_prefix
+from ..utils.provider import (
+    build_tts_updates,
+    detect_provider_change,
+    is_inference_tts,
+    strip_model_prefix,
+)
 
 if TYPE_CHECKING:
     from livekit.agents import AgentSession
@@ -17,6 +25,77 @@ if TYPE_CHECKING:
 logger = get_logger("config_handler")
 
 
+# Field mappings for the full config message: (message keys, config attribute).
+# Keys are tried in order, so legacy snake_case aliases follow the camelCase key.
+_TTS_FIELDS = (
+    (("provider",), "tts_provider"),
+    (("voice",), "tts_voice"),
+    (("speed",), "tts_speed"),
+)
+_LLM_FIELDS = (
+    (("provider",), "llm_provider"),
+    (("temperature",), "llm_temperature"),
+    (("maxTokens",), "llm_max_tokens"),
+)
+_STT_FIELDS = (
+    (("provider",), "stt_provider"),
+    (("language",), "stt_language"),
+)
+_SOUL_FIELDS = (
+    (("name",), "name"),
+    (("personality",), "personality"),
+    (("traits",), "traits"),
+    (("conversationStyle", "conversation_style"), "conversation_style"),
+    (("responseLength", "response_length"), "response_length"),
+    (("emotionalTone", "emotional_tone"), "emotional_tone"),
+)
+
+# Attributes where a falsy value (temperature 0) is a real setting; every
+# other field treats falsy values such as maxTokens 0 as unset
+_FALSY_VALID_ATTRS = frozenset({"llm_temperature"})
+
+# Voice sections of the message: (section key, fields, model attribute, provider attribute)
+_VOICE_SECTIONS = (
+    ("tts", _TTS_FIELDS, "tts_model", "tts_provider"),
+    ("llm", _LLM_FIELDS, "llm_model", "llm_provider"),
+    ("stt", _STT_FIELDS, "stt_model", "stt_provider"),
+)
+
+# TTS providers without live speed updates via update_options; a speed change
+# recreates the agent instead
+_RECREATE_ON_SPEED_CHANGE_PROVIDERS = frozenset({"elevenlabs", "rime"})
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config() -> KwamiConfig:
+    """Build the env-derived default config once (after main has loaded .env)."""
+    return KwamiConfig()
+
+
+def _new_config() -> KwamiConfig:
+    """Clone the cached default config for a full config message.
+    
+    Nested sections are copied with dataclasses.replace and every mutable
+    container is fresh, so nothing is shared with the cached template.
+    """
+    defaults = _default_config()
+    soul = defaults.soul
+    voice = defaults.voice
+    return replace(
+        defaults,
+        soul=replace(
+            soul, traits=list(soul.traits), emotional_traits=dict(soul.emotional_traits)
+        ),
+        voice=replace(
+            voice,
+            stt_word_boost=list(voice.stt_word_boost),
+            realtime_modalities=list(voice.realtime_modalities),
+        ),
+        memory=replace(defaults.memory),
+        tools=list(defaults.tools),
+    )
+
+
 def _value_from_keys(config: Dict[str, Any], *keys: str) -> Any:
     """Return the first present key value (supports falsy values)."""
     for key in keys:
@@ -25,6 +104,46 @@ def _value_from_keys(config: Dict[str, Any], *keys: str) -> Any:
     return None
 
 
+def _reusable_pipeline(agent: Any, voice: Any) -> Optional[Dict[str, Any]]:
+    """Return the current agent's STT/LLM/TTS if the new voice config matches.
+    
+    The first full config usually repeats the worker defaults the prewarmed
+    placeholder agent was built with, so its warm components can be handed
+    to the replacement agent instead of being created again.
+    """
+    if agent is None or agent.kwami_config.voice != voice:
+        return None
+    return {"stt": agent.stt, "llm": agent.llm, "tts": agent.tts}
+
+
+def _apply_fields(source: Dict[str, Any], target: Any, fields: tuple) -> None:
+    """Copy mapped message values onto a config object.
+    
+    Falsy values are skipped, except for attributes in _FALSY_VALID_ATTRS
+    where only missing, None and empty-string values are (so temperature 0
+    is applied but maxTokens 0 is not).
+    
+    Args:
+        source: Message section to read from.
+        target: Config dataclass to update.
+        fields: (message keys, attribute) pairs.
+    """
+    for keys, attr in fields:
+        value = _value_from_keys(source, *keys)
+        if value or (attr in _FALSY_VALID_ATTRS and value is not None and value != ""):
+            setattr(target, attr, value)
+
+
+def _reusable_instructions(agent: Any) -> Optional[str]:
+    """Return the current agent's system prompt for a same-soul rebuild.
+    
+    Pipeline-only swaps (LLM/TTS/STT) keep the soul, so the replacement agent
+    can reuse the live instructions, including any injected memory context,
+    instead of rendering the prompt again.
+    """
+    return getattr(agent, "instructions", None) or None
+
+
 async def handle_full_config(
     session: "AgentSession",
     state: "SessionState",
@@ -45,56 +164,31 @@ async def handle_full_config(
         logger.info("Processing full configuration...")
         
         # 1. Parse into KwamiConfig
-        new_config = KwamiConfig()
+        new_config = _new_config()
         
         # Apply frontend voice config
         voice_data = message.get("voice", {})
+        voice = new_config.voice
         
-        # TTS
-        tts_data = voice_data.get("tts", {})
-        if tts_data.get("provider"):
-            new_config.voice.tts_provider = tts_data["provider"]
-        if tts_data.get("model"):
-            # Strip provider prefix from model (e.g. "openai/tts-1" -> "tts-1")
-            tts_provider = tts_data.get("provider") or new_config.voice.tts_provider
-            new_config.voice.tts_model = strip_model_prefix(tts_data["model"], tts_provider)
-        if tts_data.get("voice"):
-            new_config.voice.tts_voice = tts_data["voice"]
-        if tts_data.get("speed"):
-            new_config.voice.tts_speed = tts_data["speed"]
-        
-        # LLM
-        llm_data = voice_data.get("llm", {})
-        if llm_data.get("provider"):
-            new_config.voice.llm_provider = llm_data["provider"]
-        if llm_data.get("model"):
-            llm_provider = llm_data.get("provider") or new_config.voice.llm_provider
-            new_config.voice.llm_model = strip_model_prefix(llm_data["model"], llm_provider)
-        if llm_data.get("temperature"):
-            new_config.voice.llm_temperature = llm_data["temperature"]
-        if llm_data.get("maxTokens"):
-            new_config.voice.llm_max_tokens = llm_data["maxTokens"]
-        
-        # STT
-        stt_data = voice_data.get("stt", {})
-        if stt_data.get("provider"):
-            new_config.voice.stt_provider = stt_data["provider"]
-        if stt_data.get("model"):
-            stt_provider = stt_data.get("provider") or new_config.voice.stt_provider
-            new_config.voice.stt_model = strip_model_prefix(stt_data["model"], stt_provider)
-        if stt_data.get("language"):
-            new_config.voice.stt_language = stt_data["language"]
+        # TTS, LLM and STT sections
+        for section_key, fields, model_attr, provider_attr in _VOICE_SECTIONS:
+            section = voice_data.get(section_key, {})
+            _apply_fields(section, voice, fields)
+            model = section.get("model")
+            if model:
+                # Strip provider prefix from model (e.g. "openai/tts-1" -> "tts-1")
+                setattr(voice, model_attr, strip_model_prefix(model, getattr(voice, provider_attr)))
         
         # Kwami details
         # Use kwamiId from message, or fall back to user_identity (participant name)
         kwami_id = message.get("kwamiId") or state.user_identity
         if kwami_id:
             new_config.kwami_id = kwami_id
-            logger.info(f"Using kwami_id for memory: {kwami_id}")
+            logger.info("Using kwami_id for memory: %s", kwami_id)
             # Update user_identity for usage reporting (may be None at session start)
             if not state.user_identity:
                 state.user_identity = kwami_id
-                logger.info(f"Set user_identity from config: {kwami_id}")
+                logger.info("Set user_identity from config: %s", kwami_id)
         if message.get("kwamiName"):
             new_config.kwami_name = message["kwamiName"]
         
@@ -102,37 +196,25 @@ async def handle_full_config(
         tools_data = message.get("tools")
         if tools_data and isinstance(tools_data, list):
             new_config.tools = tools_data
-            logger.info(f"Loaded {len(tools_data)} client tools from config")
+            logger.info("Loaded %s client tools from config", len(tools_data))
+        if message.get("batchToolCalls"):
+            new_config.batch_tool_calls = True
+        if message.get("msgpackToolCalls"):
+            new_config.msgpack_tool_calls = True
 
         # Soul (supports legacy "persona" key during migration)
         soul_data = message.get("soul") or message.get("persona", {})
-        if soul_data.get("name"):
-            new_config.soul.name = soul_data["name"]
-        if soul_data.get("personality"):
-            new_config.soul.personality = soul_data["personality"]
+        _apply_fields(soul_data, new_config.soul, _SOUL_FIELDS)
         system_prompt = _value_from_keys(soul_data, "systemPrompt", "system_prompt")
         if system_prompt is not None:
             new_config.soul.system_prompt = system_prompt
-        if soul_data.get("traits"):
-            new_config.soul.traits = soul_data["traits"]
-        conversation_style = _value_from_keys(
-            soul_data, "conversationStyle", "conversation_style"
-        )
-        if conversation_style:
-            new_config.soul.conversation_style = conversation_style
-        response_length = _value_from_keys(soul_data, "responseLength", "response_length")
-        if response_length:
-            new_config.soul.response_length = response_length
-        emotional_tone = _value_from_keys(soul_data, "emotionalTone", "emotional_tone")
-        if emotional_tone:
-            new_config.soul.emotional_tone = emotional_tone
         emotional_traits = _value_from_keys(soul_data, "emotionalTraits", "emotional_traits")
         if isinstance(emotional_traits, dict):
             new_config.soul.emotional_traits = emotional_traits
         
         # 2. Initialize Memory
-        memory = None
-        if new_config.memory.enabled or message.get("memory", {}).get("enabled"):
+        memory_requested = new_config.memory.enabled or message.get("memory", {}).get("enabled")
+        if memory_requested:
             # Update memory config if present in message
             mem_data = message.get("memory", {})
             if mem_data.get("enabled") is not None:
@@ -148,12 +230,26 @@ async def handle_full_config(
                 if not new_config.memory.user_id and new_config.kwami_id:
                     # Client sends full memory id (e.g. kwami_<auth>_<kwamiId>); use as-is so each kwami has its own memory
                     new_config.memory.user_id = new_config.kwami_id
-                memory = await create_memory(
-                    config=new_config.memory,
-                    kwami_id=new_config.kwami_id or "default",
-                    kwami_name=new_config.kwami_name,
-                    usage_tracker=state.usage_tracker,
-                )
+        
+        # A re-sent identical config (e.g. after a reconnect) keeps the live agent
+        current_agent = state.current_agent
+        if (
+            state.greeting_delivered
+            and current_agent is not None
+            and current_agent.kwami_config == new_config
+        ):
+            logger.info("Config unchanged, keeping current agent")
+            return
+        
+        memory = None
+        if memory_requested and new_config.memory.enabled:
+            # Initialized in the background; the agent waits for it on enter
+            memory = start_memory(
+                config=new_config.memory,
+                kwami_id=new_config.kwami_id or "default",
+                kwami_name=new_config.kwami_name,
+                usage_tracker=state.usage_tracker,
+            )
         
         # 3. Create NEW Agent with this config
         # Only skip greeting if one was already delivered in this session.
@@ -161,7 +257,13 @@ async def handle_full_config(
         # killing its greeting before it completes. The reconfigured agent must
         # greet in that case.
         skip_greeting = state.greeting_delivered
-        new_agent = create_agent_fn(new_config, vad, memory, skip_greeting=skip_greeting)
+        new_agent = create_agent_fn(
+            new_config,
+            vad,
+            memory,
+            skip_greeting=skip_greeting,
+            pipeline=_reusable_pipeline(current_agent, new_config.voice),
+        )
         
         # 4. Switch to new agent (state handles memory cleanup)
         state.update_agent(session, new_agent)
@@ -171,7 +273,9 @@ async def handle_full_config(
             state.greeting_delivered = True
         
         logger.info(
-            f"Reconfigured agent: {new_config.voice.llm_provider}/{new_config.voice.tts_provider}"
+            "Reconfigured agent: %s/%s",
+            new_config.voice.llm_provider,
+            new_config.voice.tts_provider,
         )
 
     except Exception as e:
@@ -237,9 +341,12 @@ async def update_voice(
         vad: Voice Activity Detection instance.
         create_agent_fn: Function to create a new agent from config.
     """
-    current_provider = agent.kwami_config.voice.tts_provider
+    current_voice_config = agent.kwami_config.voice
+    current_provider = current_voice_config.tts_provider
     new_model = config.get("tts_model")
     new_voice = config.get("tts_voice")
+    new_speed = config.get("tts_speed")
+    explicit_provider = config.get("tts_provider")
     
     # Use utility function to detect provider change
     new_provider, provider_changed = detect_provider_change(
@@ -249,31 +356,26 @@ async def update_voice(
     )
     
     # Override with explicit provider if specified
-    if config.get("tts_provider"):
-        explicit_provider = config["tts_provider"]
-        if explicit_provider != new_provider:
-            new_provider = explicit_provider
-            provider_changed = new_provider != current_provider
+    if explicit_provider and explicit_provider != new_provider:
+        new_provider = explicit_provider
+        provider_changed = new_provider != current_provider
     
     if provider_changed:
-        logger.info(f"Auto-detected provider change: {current_provider} -> {new_provider}")
+        logger.info("Auto-detected provider change: %s -> %s", current_provider, new_provider)
     
     # Some providers don't support live speed updates via update_options and need agent recreation.
     # Only trigger recreation if speed actually changed from current value.
-    recreate_on_speed_change_providers = {"elevenlabs", "rime"}
-    requires_recreate_for_speed = current_provider in recreate_on_speed_change_providers
-    is_elevenlabs = current_provider == "elevenlabs"
-    current_speed = agent.kwami_config.voice.tts_speed or 1.0
-    new_speed = config.get("tts_speed")
+    requires_recreate_for_speed = current_provider in _RECREATE_ON_SPEED_CHANGE_PROVIDERS
+    current_speed = current_voice_config.tts_speed or 1.0
     speed_actually_changed = new_speed is not None and float(new_speed) != float(current_speed)
     speed_changed = speed_actually_changed and requires_recreate_for_speed
     
     if provider_changed or speed_changed:
         reason = "provider change" if provider_changed else f"speed change ({current_provider})"
-        logger.info(f"Switching TTS: {current_provider} -> {new_provider} ({reason})")
+        logger.info("Switching TTS: %s -> %s (%s)", current_provider, new_provider, reason)
         
         # Full agent switch needed for provider change
-        new_voice_config = replace(agent.kwami_config.voice)
+        new_voice_config = replace(current_voice_config)
         new_voice_config.tts_provider = new_provider
         if new_model:
             new_voice_config.tts_model = strip_model_prefix(new_model, new_provider)
@@ -290,18 +392,24 @@ async def update_voice(
             # (e.g. Rime "astra") carries over to the new provider (e.g. ElevenLabs)
             # where it doesn't exist.
             new_voice_config.tts_voice = ""
-        if config.get("tts_speed"):
-            new_voice_config.tts_speed = config["tts_speed"]
+        if new_speed:
+            new_voice_config.tts_speed = new_speed
         
         new_config = replace(agent.kwami_config)
         new_config.voice = new_voice_config
         
-        new_agent = create_agent_fn(new_config, vad, agent._memory, skip_greeting=True)
+        new_agent = create_agent_fn(
+            new_config,
+            vad,
+            agent._memory,
+            skip_greeting=True,
+            instructions=_reusable_instructions(agent),
+        )
         state.update_agent(session, new_agent)
-        logger.info(f"Switched to {new_provider} TTS")
+        logger.info("Switched to %s TTS", new_provider)
     else:
         # Same provider - just update options if supported
-        await _update_tts_options(agent, config, new_voice, is_elevenlabs)
+        await _update_tts_options(agent, config, new_voice)
         
         # Handle STT updates
         await _update_stt_if_needed(session, state, agent, config, vad, create_agent_fn)
@@ -311,66 +419,47 @@ async def _update_tts_options(
     agent: Any,
     config: Dict[str, Any],
     new_voice: Optional[str],
-    is_elevenlabs: bool,
 ) -> None:
-    """Update TTS options without recreating the agent."""
+    """Update TTS options without recreating the agent.
+    
+    Values equal to the agent's current voice config are skipped, so repeated
+    frontend broadcasts don't make the provider reconfigure.
+    """
     if not hasattr(agent, "tts") or not agent.tts:
         return
     
-    updates = {}
-    
-    # Detect TTS provider from module or passed parameter
-    tts_provider = getattr(agent.tts, "provider", "").lower()
-    tts_module = type(agent.tts).__module__
-    tts_model = str(getattr(agent.tts, "_model", getattr(agent.tts, "model", ""))).lower()
-    
-    # Check if TTS is using LiveKit Inference (ElevenLabs, Rime, etc.)
-    is_inference_tts = "inference" in tts_module
-    is_elevenlabs_tts = (
-        is_elevenlabs
-        or tts_provider == "elevenlabs"
-        or "elevenlabs" in tts_module
-        or "elevenlabs" in tts_model
-    )
-    is_rime_tts = tts_provider == "rime" or "rime" in tts_model
-    is_openai_tts = "openai" in tts_module and not is_inference_tts
+    voice_config = agent.kwami_config.voice
+    if new_voice == voice_config.tts_voice:
+        new_voice = None
+    new_speed = config.get("tts_speed") or None
+    if new_speed is not None and float(new_speed) == float(voice_config.tts_speed or 1.0):
+        new_speed = None
     
     if new_voice:
         # Validate voice against current TTS provider to avoid sending
         # unsupported voices (e.g. Rime voice 'orion' to OpenAI fallback)
-        if is_openai_tts:
-            from ..constants import OpenAIVoices
-            if new_voice not in OpenAIVoices.STANDARD:
-                logger.warning(
-                    f"Voice '{new_voice}' not valid for current OpenAI TTS, skipping voice update. "
-                    f"Valid: {', '.join(sorted(OpenAIVoices.STANDARD))}"
-                )
-                new_voice = None  # Skip this update
-        
-        if new_voice:
-            # inference.TTS (used for ElevenLabs, Rime via LiveKit Inference)
-            # always uses "voice", not "voice_id". Only the direct
-            # elevenlabs.TTS plugin uses "voice_id".
-            if is_elevenlabs_tts and not is_inference_tts:
-                updates["voice_id"] = new_voice
-            else:
-                updates["voice"] = new_voice
+        is_openai_tts = "openai" in type(agent.tts).__module__ and not is_inference_tts(agent.tts)
+        if is_openai_tts and new_voice not in OpenAIVoices.STANDARD:
+            logger.warning(
+                "Voice '%s' not valid for current OpenAI TTS, skipping voice update. Valid: %s",
+                new_voice,
+                OpenAIVoices.STANDARD_LIST,
+            )
+            new_voice = None  # Skip this update
     
-    # LiveKit Inference TTS (ElevenLabs, Rime) doesn't support speed in update_options
-    if config.get("tts_speed") and not is_inference_tts:
-        updates["speed"] = float(config["tts_speed"])
+    updates = build_tts_updates(agent.tts, voice=new_voice, speed=new_speed)
     
     if updates and hasattr(agent.tts, "update_options"):
         try:
             agent.tts.update_options(**updates)
             # Update stored config to reflect new values
             if new_voice:
-                agent.kwami_config.voice.tts_voice = new_voice
-            if config.get("tts_speed"):
-                agent.kwami_config.voice.tts_speed = config["tts_speed"]
-            logger.info(f"Updated TTS options: {updates}")
+                voice_config.tts_voice = new_voice
+            if new_speed is not None:
+                voice_config.tts_speed = new_speed
+            logger.info("Updated TTS options: %s", updates)
         except Exception as e:
-            logger.warning(f"Failed to update TTS options: {e}")
+            logger.warning("Failed to update TTS options: %s", e)
 
 
 async def _update_stt_if_needed(
@@ -382,44 +471,49 @@ async def _update_stt_if_needed(
     create_agent_fn: Any,
 ) -> None:
     """Update STT configuration if needed."""
-    stt_provider_changed = (
-        config.get("stt_provider") and 
-        config["stt_provider"] != agent.kwami_config.voice.stt_provider
-    )
-    stt_model_changed = (
-        config.get("stt_model") and 
-        config["stt_model"] != agent.kwami_config.voice.stt_model
-    )
+    voice_config = agent.kwami_config.voice
+    new_provider = config.get("stt_provider")
+    new_model = config.get("stt_model")
+    new_language = config.get("stt_language")
+    stt_provider_changed = new_provider and new_provider != voice_config.stt_provider
+    stt_model_changed = new_model and new_model != voice_config.stt_model
     
     if stt_provider_changed or stt_model_changed:
         # STT provider/model change requires agent recreation
-        current_stt = agent.kwami_config.voice.stt_provider
-        new_stt = config.get("stt_provider", current_stt)
-        logger.info(f"Switching STT: {current_stt} -> {new_stt}")
+        current_stt = voice_config.stt_provider
+        logger.info("Switching STT: %s -> %s", current_stt, new_provider or current_stt)
         
-        new_voice_config = replace(agent.kwami_config.voice)
-        if config.get("stt_provider"):
-            new_voice_config.stt_provider = config["stt_provider"]
-        if config.get("stt_model"):
-            stt_provider = config.get("stt_provider") or new_voice_config.stt_provider
-            new_voice_config.stt_model = strip_model_prefix(config["stt_model"], stt_provider)
-        if config.get("stt_language"):
-            new_voice_config.stt_language = config["stt_language"]
+        new_voice_config = replace(voice_config)
+        if new_provider:
+            new_voice_config.stt_provider = new_provider
+        if new_model:
+            new_voice_config.stt_model = strip_model_prefix(
+                new_model, new_voice_config.stt_provider
+            )
+        if new_language:
+            new_voice_config.stt_language = new_language
         
         new_config = replace(agent.kwami_config)
         new_config.voice = new_voice_config
         
-        new_agent = create_agent_fn(new_config, vad, agent._memory, skip_greeting=True)
+        new_agent = create_agent_fn(
+            new_config,
+            vad,
+            agent._memory,
+            skip_greeting=True,
+            instructions=_reusable_instructions(agent),
+        )
         state.update_agent(session, new_agent)
-        logger.info(f"Switched to {new_voice_config.stt_provider} STT")
+        logger.info("Switched to %s STT", new_voice_config.stt_provider)
     elif hasattr(agent, "stt") and agent.stt:
         # Just update STT options (language only)
         updates = {}
-        if config.get("stt_language"):
-            updates["language"] = config["stt_language"]
+        if new_language and new_language != voice_config.stt_language:
+            updates["language"] = new_language
         if updates and hasattr(agent.stt, "update_options"):
             agent.stt.update_options(**updates)
-            logger.info(f"Updated STT options: {updates}")
+            voice_config.stt_language = new_language
+            logger.info("Updated STT options: %s", updates)
 
 
 async def update_llm(
@@ -430,7 +524,11 @@ async def update_llm(
     vad: Any,
     create_agent_fn: Any,
 ) -> None:
-    """Update LLM configuration. Always requires agent recreation.
+    """Update LLM configuration.
+    
+    Model and temperature changes within the same provider are applied to the
+    live LLM via update_options when it supports them; provider or max-token
+    changes (or a failed in-place update) recreate the agent.
     
     Args:
         session: The LiveKit agent session.
@@ -443,18 +541,45 @@ async def update_llm(
     new_config = replace(agent.kwami_config)
     new_voice = replace(new_config.voice)
     
-    if config.get("provider"):
-        new_voice.llm_provider = config["provider"]
-    if config.get("model"):
-        llm_provider = config.get("provider") or new_voice.llm_provider
-        new_voice.llm_model = strip_model_prefix(config["model"], llm_provider)
-    if config.get("temperature"):
-        new_voice.llm_temperature = config["temperature"]
-    if config.get("maxTokens"):
-        new_voice.llm_max_tokens = config["maxTokens"]
+    _apply_fields(config, new_voice, _LLM_FIELDS)
+    new_model = config.get("model")
+    if new_model:
+        new_voice.llm_model = strip_model_prefix(new_model, new_voice.llm_provider)
+    
+    voice = agent.kwami_config.voice
+    if new_voice == voice:
+        return
+    llm = getattr(agent, "llm", None)
+    if (
+        new_voice.llm_provider == voice.llm_provider
+        and new_voice.llm_max_tokens == voice.llm_max_tokens
+        and hasattr(llm, "update_options")
+    ):
+        updates: Dict[str, Any] = {}
+        if new_voice.llm_model != voice.llm_model:
+            updates["model"] = new_voice.llm_model
+        temperature = resolve_llm_temperature(new_voice)
+        if temperature != resolve_llm_temperature(voice):
+            updates["temperature"] = temperature
+        if not updates:
+            return
+        try:
+            llm.update_options(**updates)
+            voice.llm_model = new_voice.llm_model
+            voice.llm_temperature = new_voice.llm_temperature
+            logger.info("Updated LLM options: %s", updates)
+            return
+        except Exception as e:
+            logger.warning("Failed to update LLM options, recreating agent: %s", e)
     
     new_config.voice = new_voice
-    new_agent = create_agent_fn(new_config, vad, agent._memory, skip_greeting=True)
+    new_agent = create_agent_fn(
+        new_config,
+        vad,
+        agent._memory,
+        skip_greeting=True,
+        instructions=_reusable_instructions(agent),
+    )
     state.update_agent(session, new_agent)
 
 
@@ -515,7 +640,7 @@ async def update_soul(
         # Rebuild and update instructions through the session
         new_instructions = agent._build_system_prompt(memory_text)
         await agent.update_instructions(new_instructions)
-        logger.info(f"Updated soul: {soul.name} - {(soul.personality or '')[:50]}...")
+        logger.info("Updated soul: %s - %s...", soul.name, (soul.personality or '')[:50])
 
 
 async def update_tools(
@@ -546,7 +671,7 @@ async def update_tools(
         # Rebuild the full tool list (built-in + freshly registered client tools)
         combined = agent.client_tools.create_client_tools()
         agent._tools = combined
-        logger.info(f"update_tools: registered {len(tools)} client tools on running agent")
+        logger.info("update_tools: registered %s client tools on running agent", len(tools))
     except Exception as e:
         log_error(logger, "update_tools: failed to register client tools", e)
 
@@ -1,8 +1,11 @@
 """Kwami Agent - Entry point for LiveKit Cloud agent sessions."""
 
 import asyncio
-import json
+import copy
+import functools
+import logging
 from pathlib import Path
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 
@@ -22,22 +25,39 @@ from livekit.plugins import silero
 
 from .agent import KwamiAgent
 from .config import KwamiConfig
-from .factories import create_llm, create_stt, create_tts, create_realtime_model
+from .factories import (
+    create_llm,
+    create_stt,
+    create_tts,
+    create_realtime_model,
+    warmup_pipeline,
+)
 from .handlers import handle_full_config, handle_config_update, handle_tool_result
 from .memory import create_memory
 from .room_context import set_current_room
 from .runtime_bootstrap import fetch_runtime_config, resolve_kwami_id
 from .session import SessionState, create_session_state
+from .usage import UsageTracker
 from .utils.logging import get_logger
+from .utils.serialization import decode_packet, is_message_packet
 
 logger = get_logger()
 
 server = AgentServer()
 
+# Pending config messages per session; the oldest is dropped when full.
+CONFIG_QUEUE_MAXSIZE = 32
+
+# How long a config_update waits for follow-ups (e.g. a slider drag) to merge
+CONFIG_UPDATE_DEBOUNCE_SECONDS = 0.15
+
 
 def prewarm(proc: JobProcess) -> None:
-    """Prewarm the VAD model for faster startup."""
+    """Prewarm the VAD model, default config and voice pipeline for faster startup."""
     proc.userdata["vad"] = silero.VAD.load()
+    # Env-derived defaults are process-static; sessions get a private copy.
+    proc.userdata["config"] = KwamiConfig()
+    proc.userdata["pipeline"] = warmup_pipeline(proc.userdata["config"].voice)
 
 
 server.setup_fnc = prewarm
@@ -47,16 +67,20 @@ server.setup_fnc = prewarm
 async def entrypoint(ctx: JobContext) -> None:
     """Main entry point for Kwami agent sessions."""
     set_current_room(ctx.room)
-    logger.info(f"Kwami session starting in room: {ctx.room.name}")
+    logger.info("Kwami session starting in room: %s", ctx.room.name)
 
-    # Log participants and extract user identity
-    logger.info(f"Room has {len(ctx.room.remote_participants)} remote participants")
-    user_identity = None
-    for pid, p in ctx.room.remote_participants.items():
-        logger.info(f"  - {p.identity} (connected: {p.is_connected})")
-        if not p.identity.startswith("agent"):
-            user_identity = p.identity
-            logger.info(f"User identity: {user_identity}")
+    # Extract user identity (the first non-agent participant)
+    participants = ctx.room.remote_participants
+    logger.info("Room has %d remote participants", len(participants))
+    if logger.isEnabledFor(logging.DEBUG):
+        for p in participants.values():
+            logger.debug("  - %s (connected: %s)", p.identity, p.is_connected)
+    user_identity = next(
+        (p.identity for p in participants.values() if not p.identity.startswith("agent")),
+        None,
+    )
+    if user_identity:
+        logger.info("User identity: %s", user_identity)
 
     # Get prewarmed VAD
     vad = ctx.proc.userdata["vad"]
@@ -65,8 +89,14 @@ async def entrypoint(ctx: JobContext) -> None:
     # Skip greeting -- this is a placeholder agent until the frontend sends
     # the real config via the "config" data message. The configured agent
     # will greet properly with the correct persona, voice, and memory.
-    config = KwamiConfig()
-    initial_agent = create_agent_from_config(config, vad, skip_greeting=True)
+    config_template = ctx.proc.userdata.get("config")
+    config = copy.deepcopy(config_template) if config_template else KwamiConfig()
+    initial_agent = create_agent_from_config(
+        config,
+        vad,
+        skip_greeting=True,
+        pipeline=ctx.proc.userdata.pop("pipeline", None),
+    )
     
     # Create session and state
     session = AgentSession()
@@ -81,74 +111,29 @@ async def entrypoint(ctx: JobContext) -> None:
     initial_agent.usage_tracker = state.usage_tracker
 
     # Wire up metrics events for usage tracking
-    @session.on("metrics_collected")
-    def on_metrics(event):
-        metrics = event.metrics
-        metrics_type = getattr(metrics, "type", None)
-        if metrics_type == "llm_metrics":
-            state.usage_tracker.on_llm_metrics(metrics)
-        elif metrics_type == "stt_metrics":
-            state.usage_tracker.on_stt_metrics(metrics)
-        elif metrics_type == "tts_metrics":
-            state.usage_tracker.on_tts_metrics(metrics)
-        elif metrics_type == "realtime_model_metrics":
-            state.usage_tracker.on_realtime_metrics(metrics)
+    session.on("metrics_collected", functools.partial(_record_metrics, state.usage_tracker))
     
+    # Config messages swap pipelines and update plugin options, so they are
+    # applied one at a time by a single consumer instead of a task per packet.
+    config_queue: asyncio.Queue = asyncio.Queue(maxsize=CONFIG_QUEUE_MAXSIZE)
+    config_consumer = asyncio.create_task(
+        _consume_config_messages(session, state, vad, config_queue)
+    )
+
     # Setup data handler for config updates and tool results
-    def handle_data(data: rtc.DataPacket) -> None:
-        try:
-            payload = data.data.decode("utf-8")
-            message = json.loads(payload)
-            msg_type = message.get("type")
-            
-            logger.info(f"Received data message: {msg_type}")
-            
-            if msg_type == "config":
-                asyncio.create_task(
-                    handle_full_config(
-                        session, state, message, vad, create_agent_from_config
-                    )
-                )
-            elif msg_type == "config_update":
-                asyncio.create_task(
-                    handle_config_update(
-                        session, state, message, vad, create_agent_from_config
-                    )
-                )
-            elif msg_type == "tool_result":
-                handle_tool_result(
-                    state.current_agent,
-                    message.get("toolCallId"),
-                    message.get("result"),
-                    message.get("error"),
-                )
-            elif msg_type == "browser_close_request":
-                # Frontend user clicked the browser panel close button
-                if state.current_agent:
-                    browser_session = getattr(state.current_agent, "_browser_session", None)
-                    if browser_session and browser_session.is_active:
-                        asyncio.create_task(browser_session.close())
-                        logger.info("Closing cloud browser per user request")
-
-            elif msg_type == "search_similar":
-                # Client "Find similar" button: run a product search like the selected result
-                title = (message.get("title") or "").strip() or "similar products"
-                url = message.get("url") or ""
-                if state.current_agent and title:
-                    query = f"similar to {title[:80]} buy"
-                    logger.info("Running similar search from client: query=%s", query[:60])
-                    ctx_simple = type("Ctx", (), {"room": ctx.room})()
-                    asyncio.create_task(
-                        state.current_agent.web_search(ctx_simple, query, max_results=5, search_for_products=True)
-                    )
-                
-        except Exception as e:
-            logger.error(f"Error handling data message: {e}")
+    data_handler = functools.partial(
+        _handle_data, asyncio.get_running_loop(), ctx.room, state, config_queue
+    )
+    ctx.room.on("data_received", data_handler)
 
-    ctx.room.on("data_received", handle_data)
+    async def stop_config_handling() -> None:
+        # Stop routing packets into a session that is shutting down
+        ctx.room.off("data_received", data_handler)
+        config_consumer.cancel()
 
     # Register cleanup for when the session ends
     ctx.add_shutdown_callback(state.cleanup)
+    ctx.add_shutdown_callback(stop_config_handling)
 
     # Start the session
     await session.start(
@@ -173,7 +158,171 @@ async def entrypoint(ctx: JobContext) -> None:
                 create_agent_from_config,
             )
     
-    logger.info(f"Kwami session started for room: {ctx.room.name}")
+    logger.info("Kwami session started for room: %s", ctx.room.name)
+
+
+async def _consume_config_messages(
+    session: AgentSession,
+    state: SessionState,
+    vad,
+    config_queue: asyncio.Queue,
+) -> None:
+    """Apply queued config messages one at a time for the session's lifetime.
+    
+    A config_update first waits briefly, then absorbs queued updates of the
+    same kind, so a burst of changes is applied (and any agent rebuilt) once.
+    """
+    carry = None
+    while True:
+        if carry is None:
+            message = await config_queue.get()
+        else:
+            message, carry = carry, None
+        if message.get("type") == "config_update":
+            await asyncio.sleep(CONFIG_UPDATE_DEBOUNCE_SECONDS)
+            while not config_queue.empty():
+                queued = config_queue.get_nowait()
+                merged = _merge_config_updates(message, queued)
+                if merged is None:
+                    # Applied next, keeping the original order
+                    carry = queued
+                    break
+                message = merged
+        try:
+            if message.get("type") == "config":
+                await handle_full_config(
+                    session, state, message, vad, create_agent_from_config
+                )
+            else:
+                await handle_config_update(
+                    session, state, message, vad, create_agent_from_config
+                )
+        except Exception as e:
+            logger.error("Error applying config message: %s", e)
+
+
+def _merge_config_updates(current: dict, queued: dict) -> Optional[dict]:
+    """Combine two consecutive config_update messages into one.
+    
+    Args:
+        current: The update about to be applied.
+        queued: The update queued right after it.
+        
+    Returns:
+        A single update equivalent to applying both in order, or None if the
+        messages are not config_updates of the same updateType.
+    """
+    if (
+        queued.get("type") != "config_update"
+        or queued.get("updateType") != current.get("updateType")
+    ):
+        return None
+    current_config = current.get("config")
+    queued_config = queued.get("config")
+    if isinstance(current_config, dict) and isinstance(queued_config, dict):
+        return {**queued, "config": {**current_config, **queued_config}}
+    # Non-dict payloads (e.g. the tools list) are full replacements
+    return queued
+
+
+def _enqueue_config_message(config_queue: asyncio.Queue, message: dict) -> None:
+    """Queue a config message, making room by dropping the oldest update.
+    
+    A pending full "config" is never evicted for an update, since later
+    updates would otherwise apply to the placeholder agent. Only when the
+    queue holds nothing but full configs is the oldest one dropped, as a
+    newer full config supersedes it.
+    
+    Args:
+        config_queue: The config consumer's queue.
+        message: A "config" or "config_update" message.
+    """
+    if config_queue.full():
+        pending = [config_queue.get_nowait() for _ in range(config_queue.qsize())]
+        drop = next(
+            (i for i, queued in enumerate(pending) if queued.get("type") == "config_update"),
+            0,
+        )
+        dropped = pending.pop(drop)
+        logger.warning("Config queue full, dropped oldest pending %s", dropped.get("type"))
+        for queued in pending:
+            config_queue.put_nowait(queued)
+    config_queue.put_nowait(message)
+
+
+def _record_metrics(usage_tracker: UsageTracker, event: Any) -> None:
+    """Forward a session metrics event to the usage tracker.
+    
+    Args:
+        usage_tracker: The session's usage tracker.
+        event: The "metrics_collected" event.
+    """
+    metrics = event.metrics
+    metrics_type = getattr(metrics, "type", None)
+    if metrics_type == "llm_metrics":
+        usage_tracker.on_llm_metrics(metrics)
+    elif metrics_type == "stt_metrics":
+        usage_tracker.on_stt_metrics(metrics)
+    elif metrics_type == "tts_metrics":
+        usage_tracker.on_tts_metrics(metrics)
+    elif metrics_type == "realtime_model_metrics":
+        usage_tracker.on_realtime_metrics(metrics)
+
+
+def _handle_data(
+    loop: asyncio.AbstractEventLoop,
+    room: rtc.Room,
+    state: SessionState,
+    config_queue: asyncio.Queue,
+    data: rtc.DataPacket,
+) -> None:
+    """Dispatch a data channel packet from the frontend.
+    
+    Config messages go to the config consumer's queue and tool results are
+    resolved inline; only the rare browser/search actions spawn a task, on
+    the loop captured when the handler was registered.
+    """
+    if not is_message_packet(data.data, data.topic):
+        logger.debug("Ignoring non-message data packet (%d bytes)", len(data.data or b""))
+        return
+
+    try:
+        message = decode_packet(data.data, data.topic)
+        msg_type = message.get("type")
+
+        logger.info("Received data message: %s", msg_type)
+
+        if msg_type in ("config", "config_update"):
+            _enqueue_config_message(config_queue, message)
+        elif msg_type == "tool_result":
+            handle_tool_result(
+                state.current_agent,
+                message.get("toolCallId"),
+                message.get("result"),
+                message.get("error"),
+            )
+        elif msg_type == "browser_close_request":
+            # Frontend user clicked the browser panel close button
+            if state.current_agent:
+                browser_session = getattr(state.current_agent, "_browser_session", None)
+                if browser_session and browser_session.is_active:
+                    loop.create_task(browser_session.close())
+                    logger.info("Closing cloud browser per user request")
+
+        elif msg_type == "search_similar":
+            # Client "Find similar" button: run a product search like the selected result
+            title = (message.get("title") or "").strip() or "similar products"
+            url = message.get("url") or ""
+            if state.current_agent and title:
+                query = f"similar to {title[:80]} buy"
+                logger.info("Running similar search from client: query=%s", query[:60])
+                ctx_simple = type("Ctx", (), {"room": room})()
+                loop.create_task(
+                    state.current_agent.web_search(ctx_simple, query, max_results=5, search_for_products=True)
+                )
+
+    except Exception as e:
+        logger.error("Error handling data message: %s", e)
 
 
 def create_agent_from_config(
@@ -181,6 +330,8 @@ def create_agent_from_config(
     vad,
     memory=None,
     skip_greeting: bool = False,
+    pipeline: Optional[dict] = None,
+    instructions: Optional[str] = None,
 ) -> KwamiAgent:
     """Create a KwamiAgent instance from a configuration object.
     
@@ -189,6 +340,9 @@ def create_agent_from_config(
         vad: Voice Activity Detection instance.
         memory: Optional memory instance.
         skip_greeting: If True, skip the initial greeting (for reconfigurations).
+        pipeline: Optional prewarmed "stt"/"llm"/"tts" instances to use
+            instead of creating new ones (standard pipeline only).
+        instructions: Optional prebuilt system prompt to reuse.
         
     Returns:
         Configured KwamiAgent instance.
@@ -197,8 +351,9 @@ def create_agent_from_config(
     
     if voice_config.pipeline_type == "realtime":
         logger.info(
-            f"Using realtime pipeline: "
-            f"{voice_config.realtime_provider}/{voice_config.realtime_model}"
+            "Using realtime pipeline: %s/%s",
+            voice_config.realtime_provider,
+            voice_config.realtime_model,
         )
         realtime_model = create_realtime_model(voice_config)
         return KwamiAgent(
@@ -207,17 +362,22 @@ def create_agent_from_config(
             memory=memory,
             llm=realtime_model,
             skip_greeting=skip_greeting,
+            instructions=instructions,
         )
     else:
         logger.info(
-            f"Using standard pipeline: "
-            f"STT={voice_config.stt_provider}/{voice_config.stt_model}, "
-            f"LLM={voice_config.llm_provider}/{voice_config.llm_model}, "
-            f"TTS={voice_config.tts_provider}/{voice_config.tts_model}"
+            "Using standard pipeline: STT=%s/%s, LLM=%s/%s, TTS=%s/%s",
+            voice_config.stt_provider,
+            voice_config.stt_model,
+            voice_config.llm_provider,
+            voice_config.llm_model,
+            voice_config.tts_provider,
+            voice_config.tts_model,
         )
-        stt = create_stt(voice_config)
-        llm = create_llm(voice_config)
-        tts = create_tts(voice_config)
+        pipeline = pipeline or {}
+        stt = pipeline.get("stt") or create_stt(voice_config)
+        llm = pipeline.get("llm") or create_llm(voice_config)
+        tts = pipeline.get("tts") or create_tts(voice_config)
         return KwamiAgent(
             config,
             vad=vad,
@@ -226,6 +386,7 @@ def create_agent_from_config(
             llm=llm,
             tts=tts,
             skip_greeting=skip_greeting,
+            instructions=instructions,
         )
 
 
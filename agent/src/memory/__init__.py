@@ -5,13 +5,14 @@ fact extraction, and context retrieval for LLM injection.
 """
 
 from .context import MemoryContext
-from .manager import KwamiMemory, create_memory
+from .manager import KwamiMemory, create_memory, start_memory
 from .ontology import DEFAULT_EDGE_TYPES, DEFAULT_ENTITY_TYPES
 
 __all__ = [
     "KwamiMemory",
     "MemoryContext",
     "create_memory",
+    "start_memory",
     "DEFAULT_ENTITY_TYPES",
     "DEFAULT_EDGE_TYPES",
 ]
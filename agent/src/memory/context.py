@@ -5,7 +5,10 @@ Uses Zep context templates for consistent, structured retrieval and
 includes temporal validity information for facts.
 """
 
-from dataclasses import dataclass
+import asyncio
+import functools
+import re
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional
 
 from .utils import logger
@@ -18,10 +21,28 @@ TEMPLATE_PREFIX = "kwami-context"
 MAX_CONTEXT_BLOCK_CHARS = 2200
 MAX_SUMMARY_CHARS = 600
 MAX_FACTS = 8
+# Edges requested from graph search: MAX_FACTS plus headroom for the
+# assistant facts filtered out client-side
+FACT_SEARCH_LIMIT = 12
 MAX_FACT_CHARS = 180
 MAX_ENTITIES = 6
 MAX_ENTITY_SUMMARY_CHARS = 120
 
+# Upper bound on remembered template setups before the set is reset
+MAX_TEMPLATE_SETUP_CACHE_ENTRIES = 1024
+
+# (template_id, template content) pairs already written to Zep by this process
+_template_setup_cache: set[tuple[str, str]] = set()
+
+# Header of the fallback facts section
+_FACTS_SECTION_HEADER = (
+    "## Known Facts About the Human User\n"
+    "These facts are about the HUMAN you are talking to "
+    "(NOT about you, the assistant).\n"
+    "Facts marked as 'present' are currently valid. "
+    "Facts with a past end date are no longer valid."
+)
+
 # Default context template definition
 # Uses Zep template variables for structured retrieval
 DEFAULT_CONTEXT_TEMPLATE = """# USER PROFILE
@@ -34,7 +55,7 @@ DEFAULT_CONTEXT_TEMPLATE = """# USER PROFILE
 %{entities limit=10}"""
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryContext:
     """Context retrieved from Zep memory for LLM injection."""
 
@@ -42,14 +63,9 @@ class MemoryContext:
     """Pre-formatted context block from Zep context template."""
 
     summary: Optional[str] = None
-    facts: list[str] = None
-    entities: list[dict] = None
-    recent_messages: list[dict] = None
-
-    def __post_init__(self):
-        self.facts = self.facts or []
-        self.entities = self.entities or []
-        self.recent_messages = self.recent_messages or []
+    facts: list[str] = field(default_factory=list)
+    entities: list[dict] = field(default_factory=list)
+    recent_messages: list[dict] = field(default_factory=list)
 
     def to_system_prompt_addition(self) -> str:
         """Convert memory context to text for system prompt injection.
@@ -62,35 +78,44 @@ class MemoryContext:
         if self.context_block:
             return self.context_block[:MAX_CONTEXT_BLOCK_CHARS]
 
-        # Fallback: manually format from components
-        parts = []
+        # Fallback: manually format from components as one list of lines,
+        # with an empty line between sections, joined once
+        lines: list[str] = []
+        append = lines.append
 
         if self.summary:
-            parts.append(f"## Conversation Summary\n{self.summary[:MAX_SUMMARY_CHARS]}")
+            append("## Conversation Summary")
+            append(self.summary[:MAX_SUMMARY_CHARS])
 
         if self.facts:
-            facts_text = "\n".join(f"- {fact[:MAX_FACT_CHARS]}" for fact in self.facts[:MAX_FACTS])
-            parts.append(
-                "## Known Facts About the Human User\n"
-                "These facts are about the HUMAN you are talking to "
-                "(NOT about you, the assistant).\n"
-                "Facts marked as 'present' are currently valid. "
-                "Facts with a past end date are no longer valid.\n"
-                f"{facts_text}"
-            )
+            if lines:
+                append("")
+            append(_FACTS_SECTION_HEADER)
+            lines.extend(f"- {fact[:MAX_FACT_CHARS]}" for fact in self.facts[:MAX_FACTS])
 
         if self.entities:
-            entities_text = "\n".join(
+            if lines:
+                append("")
+            append("## Relevant Entities")
+            lines.extend(
                 f"- {str(e.get('name', 'Unknown'))[:60]}: "
                 f"{str(e.get('summary', e.get('type', 'entity')))[:MAX_ENTITY_SUMMARY_CHARS]}"
                 for e in self.entities[:MAX_ENTITIES]
             )
-            parts.append(f"## Relevant Entities\n{entities_text}")
 
-        if not parts:
-            return ""
+        return "\n".join(lines)
+
+
+def _is_not_found_error(error: Exception) -> bool:
+    """Check whether a Zep API error means the resource does not exist."""
+    return getattr(error, "status_code", None) == 404 or "not found" in str(error).lower()
+
 
-        return "\n\n".join(parts)
+def _remember_template_setup(cache_key: tuple[str, str]) -> None:
+    """Record a template that is known to be up to date in Zep."""
+    if len(_template_setup_cache) >= MAX_TEMPLATE_SETUP_CACHE_ENTRIES:
+        _template_setup_cache.clear()
+    _template_setup_cache.add(cache_key)
 
 
 async def setup_context_template(
@@ -101,7 +126,8 @@ async def setup_context_template(
     """Create or update a context template for this user.
 
     Context templates provide consistent, structured context retrieval
-    with automatic relevance detection by Zep.
+    with automatic relevance detection by Zep. A template this process has
+    already written with the same content is not sent again.
 
     Args:
         client: The async Zep client.
@@ -113,18 +139,24 @@ async def setup_context_template(
     """
     template_id = f"{TEMPLATE_PREFIX}-{user_id}"
     template_content = template or DEFAULT_CONTEXT_TEMPLATE
+    cache_key = (template_id, template_content)
+    if cache_key in _template_setup_cache:
+        return template_id
 
     try:
-        # Try to update existing template first
+        # Most users already have a template, so update first; only a
+        # not-found error falls through to creating it
         try:
             await client.context.update_context_template(
                 template_id=template_id,
                 template=template_content,
             )
             logger.debug(f"Updated context template: {template_id}")
+            _remember_template_setup(cache_key)
             return template_id
-        except Exception:
-            pass
+        except Exception as e:
+            if not _is_not_found_error(e):
+                raise
 
         # Create new template
         await client.context.create_context_template(
@@ -132,6 +164,7 @@ async def setup_context_template(
             template=template_content,
         )
         logger.info(f"Created context template: {template_id}")
+        _remember_template_setup(cache_key)
         return template_id
 
     except Exception as e:
@@ -145,7 +178,7 @@ async def get_context(
     session_id: str,
     template_id: str | None = None,
     kwami_name: str = "Kwami",
-    max_messages: int = 10,
+    max_messages: int = 5,
     min_relevance: float = 0.5,
     include_facts: bool = True,
 ) -> MemoryContext:
@@ -169,68 +202,127 @@ async def get_context(
     """
     context = MemoryContext()
 
-    # Strategy 1: Use context template (preferred)
-    if template_id:
-        try:
-            user_context = await client.thread.get_user_context(
-                thread_id=session_id,
-                template_id=template_id,
+    # Recent messages are always needed (not part of the context template),
+    # so fetch them while the template or fallback requests are in flight.
+    messages_task = asyncio.create_task(
+        _fetch_recent_messages(client, session_id, max_messages)
+    )
+    try:
+        # Strategy 1: Use context template (preferred)
+        if template_id:
+            context.context_block = await _fetch_template_context(
+                client, session_id, template_id
             )
-            if user_context and user_context.context:
-                context.context_block = user_context.context
-                logger.debug("Retrieved context via template")
-        except Exception as e:
-            logger.debug(f"Template-based context failed, falling back: {e}")
 
-    # Strategy 2: Fallback to thread context + graph search
-    if not context.context_block:
-        # Get thread context (summary)
-        try:
-            thread_context = await client.thread.get_context(
-                thread_id=session_id,
-                min_score=min_relevance,
-            )
-            if thread_context and thread_context.context:
-                context.summary = thread_context.context
-        except Exception as e:
-            logger.debug(f"Could not retrieve thread context: {e}")
-
-        # Get facts via graph search
-        if include_facts:
-            try:
-                facts_response = await client.graph.search(
-                    user_id=user_id,
-                    query="user information preferences interests goals",
-                    scope="edges",
-                    reranker="cross_encoder",
-                    limit=20,
+        # Strategy 2: Fallback to thread context (summary) + graph search (facts)
+        if not context.context_block:
+            if include_facts:
+                context.summary, context.facts = await asyncio.gather(
+                    _fetch_thread_summary(client, session_id, min_relevance),
+                    _fetch_facts(client, user_id, kwami_name),
+                )
+            else:
+                context.summary = await _fetch_thread_summary(
+                    client, session_id, min_relevance
                 )
-                if facts_response and facts_response.edges:
-                    assistant_lower = kwami_name.lower()
-                    for edge in facts_response.edges:
-                        fact = getattr(edge, "fact", None)
-                        if not fact:
-                            continue
-                        # Skip facts about the assistant
-                        if _is_assistant_fact(fact, assistant_lower):
-                            continue
-                        # Include temporal validity
-                        valid_at = getattr(edge, "valid_at", None)
-                        invalid_at = getattr(edge, "invalid_at", None)
-                        if invalid_at and str(invalid_at) != "present":
-                            fact = f"{fact} (no longer valid since {invalid_at})"
-                        context.facts.append(fact)
-            except Exception as e:
-                logger.debug(f"Could not retrieve facts via graph: {e}")
-
-    # Always get recent messages (not part of context template)
+
+        context.recent_messages = await messages_task
+    finally:
+        # No-op once awaited; stops the request if we were cancelled
+        messages_task.cancel()
+
+    logger.debug(
+        f"Retrieved context: template={'yes' if context.context_block else 'no'}, "
+        f"{len(context.facts)} facts, {len(context.recent_messages)} messages"
+    )
+    return context
+
+
+async def _fetch_template_context(
+    client: "AsyncZep", session_id: str, template_id: str
+) -> Optional[str]:
+    """Fetch the pre-formatted context block for a context template."""
+    try:
+        user_context = await client.thread.get_user_context(
+            thread_id=session_id,
+            template_id=template_id,
+        )
+        if user_context and user_context.context:
+            logger.debug("Retrieved context via template")
+            return user_context.context
+    except Exception as e:
+        logger.debug(f"Template-based context failed, falling back: {e}")
+    return None
+
+
+async def _fetch_thread_summary(
+    client: "AsyncZep", session_id: str, min_relevance: float
+) -> Optional[str]:
+    """Fetch the thread context summary."""
+    try:
+        thread_context = await client.thread.get_context(
+            thread_id=session_id,
+            min_score=min_relevance,
+        )
+        if thread_context and thread_context.context:
+            return thread_context.context
+    except Exception as e:
+        logger.debug(f"Could not retrieve thread context: {e}")
+    return None
+
+
+async def _fetch_facts(client: "AsyncZep", user_id: str, kwami_name: str) -> list[str]:
+    """Fetch user facts via graph search, skipping facts about the assistant."""
+    facts: list[str] = []
+    try:
+        facts_response = await client.graph.search(
+            user_id=user_id,
+            query="user information preferences interests goals",
+            scope="edges",
+            reranker="cross_encoder",
+            limit=FACT_SEARCH_LIMIT,
+        )
+        if facts_response and facts_response.edges:
+            # Resolve the assistant matcher once instead of per edge
+            is_assistant_fact = _assistant_fact_pattern(kwami_name.lower()).search
+            # Zep can return the same fact from several episodes
+            seen: set[str] = set()
+            for edge in facts_response.edges:
+                try:
+                    fact = edge.fact
+                    invalid_at = edge.invalid_at
+                except AttributeError:
+                    # A malformed edge shouldn't discard the rest
+                    continue
+                # Skip empty facts and facts about the assistant
+                if not fact or is_assistant_fact(fact.lower()):
+                    continue
+                # Include temporal validity
+                if invalid_at and str(invalid_at) != "present":
+                    fact = f"{fact} (no longer valid since {invalid_at})"
+                # Deduplicated after the validity suffix, so a still-valid
+                # fact and its expired version are both kept
+                key = fact.casefold()
+                if key in seen:
+                    continue
+                seen.add(key)
+                facts.append(fact)
+    except Exception as e:
+        logger.debug(f"Could not retrieve facts via graph: {e}")
+    return facts
+
+
+async def _fetch_recent_messages(
+    client: "AsyncZep", session_id: str, max_messages: int
+) -> list[dict]:
+    """Fetch the most recent thread messages as role/content dicts."""
     try:
         messages_response = await client.thread.get_messages(
             thread_id=session_id,
             limit=max_messages,
         )
         if messages_response and messages_response.messages:
-            context.recent_messages = [
+            return [
                 {
                     "role": msg.role or msg.role_type,
                     "content": msg.content,
@@ -239,12 +331,26 @@ async def get_context(
             ]
     except Exception as e:
         logger.debug(f"Could not retrieve thread messages: {e}")
+    return []
 
-    logger.debug(
-        f"Retrieved context: template={'yes' if context.context_block else 'no'}, "
-        f"{len(context.facts)} facts, {len(context.recent_messages)} messages"
+
+@functools.lru_cache(maxsize=32)
+def _assistant_fact_pattern(assistant_name_lower: str) -> re.Pattern:
+    """Compile the phrases that mark a fact as being about the assistant.
+
+    Matches facts that start with the assistant's name, or that describe
+    its identity ("<name> is", "called <name>", "i am <name>", ...).
+
+    Args:
+        assistant_name_lower: Lowercase assistant/kwami name.
+
+    Returns:
+        Pattern to search against a lowercased fact.
+    """
+    name = re.escape(assistant_name_lower)
+    return re.compile(
+        rf"^{name} |{name} (?:is|was|can)|(?:name is|called|named|i'm|i am) {name}"
     )
-    return context
 
 
 def _is_assistant_fact(fact: str, assistant_name_lower: str) -> bool:
@@ -260,21 +366,4 @@ def _is_assistant_fact(fact: str, assistant_name_lower: str) -> bool:
     Returns:
         True if the fact is about the assistant.
     """
-    fact_lower = fact.lower()
-
-    # Skip facts that start with the assistant's name
-    if fact_lower.startswith(assistant_name_lower + " "):
-        return True
-
-    # Skip facts describing the assistant's identity
-    identity_phrases = [
-        f"{assistant_name_lower} is",
-        f"{assistant_name_lower} was",
-        f"{assistant_name_lower} can",
-        f"name is {assistant_name_lower}",
-        f"called {assistant_name_lower}",
-        f"named {assistant_name_lower}",
-        f"i'm {assistant_name_lower}",
-        f"i am {assistant_name_lower}",
-    ]
-    return any(phrase in fact_lower for phrase in identity_phrases)
+    return _assistant_fact_pattern(assistant_name_lower).search(fact.lower()) is not None
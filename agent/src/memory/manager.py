@@ -12,6 +12,8 @@ Key improvements over monolithic memory.py:
 - Proper edge source/target constraints (via ontology module)
 """
 
+import asyncio
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
@@ -30,6 +32,12 @@ from .utils import get_zep_imports, logger
 if TYPE_CHECKING:
     from zep_cloud.client import AsyncZep
 
+# Upper bound on messages sent in one add_messages call by the writer task
+MAX_MESSAGES_PER_WRITE = 30
+
+# Seconds close() waits for queued messages to be written before giving up
+WRITE_DRAIN_TIMEOUT_SECONDS = 5.0
+
 
 class KwamiMemory:
     """Memory manager for a single Kwami instance.
@@ -57,14 +65,24 @@ class KwamiMemory:
         self._user_id: Optional[str] = None
         self._session_id: Optional[str] = None
         self._initialized = False
+        self._init_task: Optional[asyncio.Task] = None
+        self._warmup_task: Optional[asyncio.Task] = None
         self._template_id: Optional[str] = None
 
         # Message batching: buffer user message to send with assistant response
         self._pending_user_message: Optional[tuple[str, str | None]] = None
 
+        # Background writer: turn hooks enqueue (messages, ignore_roles) and
+        # return immediately; one task drains the queue into add_messages calls
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
         # Cached user name (avoid repeated lookups)
         self._cached_user_name: Optional[str] = None
 
+        # Last retrieved context as (monotonic timestamp, context); cleared on writes
+        self._context_cache: Optional[tuple[float, MemoryContext]] = None
+
     # ========================================================================
     # Properties
     # ========================================================================
@@ -155,6 +173,63 @@ class KwamiMemory:
             self._initialized = False
             return False
 
+    def start_initialize(self) -> None:
+        """Start initialize() in the background.
+
+        Use wait_until_ready() to wait for it where memory is first needed.
+        When context injection is enabled, the user name and context are
+        prefetched as soon as initialization succeeds, so the agent's first
+        get_context() is served from the cache.
+        """
+        if self._init_task is None:
+            self._init_task = asyncio.create_task(self.initialize())
+            if self.config.auto_inject_context:
+                self._warmup_task = asyncio.create_task(self._warm_context())
+
+    async def _warm_context(self) -> None:
+        """Prefetch the user name and memory context once initialized."""
+        if not await self.wait_until_ready():
+            return
+        await asyncio.gather(self._lookup_user_name(), self._fetch_context())
+
+    async def _join_warmup(self) -> bool:
+        """Wait for an in-flight prefetch instead of duplicating its requests.
+
+        Returns:
+            True if a prefetch was awaited, False if none was running or it
+            was cancelled.
+        """
+        warmup = self._warmup_task
+        if warmup is None or warmup.done():
+            return False
+        try:
+            await asyncio.shield(warmup)
+        except asyncio.CancelledError:
+            # close() cancelled the prefetch; only propagate our own cancellation
+            if warmup.cancelled():
+                return False
+            raise
+        return True
+
+    async def wait_until_ready(self) -> bool:
+        """Wait for a background initialization, if one was started.
+
+        Returns:
+            True if memory is initialized and usable, False otherwise
+            (including when close() cancelled the initialization).
+        """
+        init_task = self._init_task
+        if init_task is not None:
+            try:
+                # Shielded so a cancelled caller doesn't abort initialization
+                await asyncio.shield(init_task)
+            except asyncio.CancelledError:
+                # close() cancelled initialization; only propagate our own cancellation
+                if init_task.cancelled():
+                    return False
+                raise
+        return self._initialized
+
     async def _ensure_user_exists(self) -> None:
         """Create user in Zep if it doesn't exist.
 
@@ -244,7 +319,8 @@ class KwamiMemory:
 
         This is the PRIMARY method for adding messages to memory.
         It implements Zep's recommended pattern:
-        1. Sends both messages in a single API call
+        1. Sends both messages in a single API call (queued for the
+           background writer, so the caller never waits on Zep)
         2. Includes the `name` field for better entity extraction
         3. Uses `ignore_roles=["assistant"]` so assistant messages provide
            context but don't create graph entities
@@ -292,25 +368,11 @@ class KwamiMemory:
         if not messages:
             return
 
-        try:
-            await self._client.thread.add_messages(
-                thread_id=self._session_id,
-                messages=messages,
-                ignore_roles=["assistant"],
-            )
-            self._record_usage("zep/add_messages")
-            logger.debug(
-                f"Added {len(messages)} messages to memory "
-                f"(user: {user_name}, assistant: {assistant_name})"
-            )
-        except Exception as e:
-            import traceback
-
-            logger.error(
-                f"Failed to add messages to memory: {type(e).__name__}: {e}\n"
-                f"Messages count: {len(messages)}\n"
-                f"Traceback: {traceback.format_exc()}"
-            )
+        self._enqueue_messages(messages, ["assistant"])
+        logger.debug(
+            f"Queued {len(messages)} messages for memory "
+            f"(user: {user_name}, assistant: {assistant_name})"
+        )
 
     async def add_message(
         self, role: str, content: str, name: str | None = None
@@ -332,53 +394,37 @@ class KwamiMemory:
         if not content or not content.strip():
             return
 
-        try:
-            _, ZepMessage, _ = get_zep_imports()
-            if ZepMessage is None:
-                return
-
-            role = role.lower().strip()
-            if role not in ("user", "assistant", "system"):
-                logger.warning(f"Unknown role '{role}', defaulting to 'user'")
-                role = "user"
-
-            # Determine the name for the message
-            if not name:
-                if role == "user":
-                    name = self._cached_user_name or "User"
-                elif role == "assistant":
-                    name = self.kwami_name
-                else:
-                    name = "System"
-
-            now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-            message = ZepMessage(
-                role=role,
-                content=content.strip(),
-                name=name,
-                created_at=now,
-            )
+        _, ZepMessage, _ = get_zep_imports()
+        if ZepMessage is None:
+            return
 
-            # Use ignore_roles for assistant messages
-            ignore_roles = ["assistant"] if role != "system" else None
+        role = role.lower().strip()
+        if role not in ("user", "assistant", "system"):
+            logger.warning(f"Unknown role '{role}', defaulting to 'user'")
+            role = "user"
 
-            await self._client.thread.add_messages(
-                thread_id=self._session_id,
-                messages=[message],
-                ignore_roles=ignore_roles,
-            )
-            self._record_usage("zep/add_messages")
+        # Determine the name for the message
+        if not name:
+            if role == "user":
+                name = self._cached_user_name or "User"
+            elif role == "assistant":
+                name = self.kwami_name
+            else:
+                name = "System"
 
-            logger.debug(f"Added {role} message to memory: {content[:50]}...")
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        message = ZepMessage(
+            role=role,
+            content=content.strip(),
+            name=name,
+            created_at=now,
+        )
 
-        except Exception as e:
-            import traceback
+        # Use ignore_roles for assistant messages
+        ignore_roles = ["assistant"] if role != "system" else None
 
-            logger.error(
-                f"Failed to add message to memory: {type(e).__name__}: {e}\n"
-                f"Role: {role}, Content length: {len(content)}\n"
-                f"Traceback: {traceback.format_exc()}"
-            )
+        self._enqueue_messages([message], ignore_roles)
+        logger.debug(f"Queued {role} message for memory: {content[:50]}...")
 
     async def _flush_pending_message(self) -> None:
         """Flush a buffered user message without an assistant response.
@@ -396,23 +442,76 @@ class KwamiMemory:
         if ZepMessage is None:
             return
 
-        try:
-            user_name = name or self._cached_user_name or "User"
-            now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-            message = ZepMessage(
-                role="user",
-                content=content,
-                name=user_name,
-                created_at=now,
-            )
-            await self._client.thread.add_messages(
-                thread_id=self._session_id,
-                messages=[message],
-            )
-            self._record_usage("zep/add_messages")
-            logger.debug(f"Flushed pending user message: {content[:50]}...")
-        except Exception as e:
-            logger.warning(f"Failed to flush pending message: {e}")
+        user_name = name or self._cached_user_name or "User"
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        message = ZepMessage(
+            role="user",
+            content=content,
+            name=user_name,
+            created_at=now,
+        )
+        # ignore_roles only affects assistant messages, so a lone user message
+        # can share a batch with the exchanges queued around it
+        self._enqueue_messages([message], ["assistant"])
+        logger.debug(f"Flushed pending user message: {content[:50]}...")
+
+    def _enqueue_messages(self, messages: list, ignore_roles: list[str] | None) -> None:
+        """Queue messages for the background writer, starting it if needed.
+
+        Args:
+            messages: Zep messages to persist, in order.
+            ignore_roles: Roles Zep should not extract graph entities from.
+        """
+        # New messages can change facts, summary and recent messages
+        self._context_cache = None
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain_write_queue())
+        self._write_queue.put_nowait((messages, ignore_roles))
+
+    async def _drain_write_queue(self) -> None:
+        """Write queued messages to Zep, merging whatever has piled up.
+
+        Consecutive entries with the same ignore_roles are combined into a
+        single add_messages call (up to MAX_MESSAGES_PER_WRITE messages), so
+        a burst of turns costs one round trip instead of one per turn.
+        """
+        queue = self._write_queue
+        carry = None
+        while True:
+            if carry is None:
+                messages, ignore_roles = await queue.get()
+            else:
+                (messages, ignore_roles), carry = carry, None
+            batch = list(messages)
+            taken = 1
+            while not queue.empty():
+                entry = queue.get_nowait()
+                if (
+                    entry[1] != ignore_roles
+                    or len(batch) + len(entry[0]) > MAX_MESSAGES_PER_WRITE
+                ):
+                    # Written by the next round, in its original order
+                    carry = entry
+                    break
+                batch.extend(entry[0])
+                taken += 1
+
+            try:
+                if self._client:
+                    await self._client.thread.add_messages(
+                        thread_id=self._session_id,
+                        messages=batch,
+                        ignore_roles=ignore_roles,
+                    )
+                    self._record_usage("zep/add_messages")
+                    logger.debug(f"Added {len(batch)} messages to memory")
+            except Exception:
+                logger.exception("Failed to add %d messages to memory", len(batch))
+            finally:
+                for _ in range(taken):
+                    queue.task_done()
 
     async def add_fact(self, fact: str) -> None:
         """Add a fact about the user as a system message.
@@ -433,15 +532,40 @@ class KwamiMemory:
     # Context Retrieval
     # ========================================================================
 
-    async def get_context(self) -> MemoryContext:
+    async def get_context(self, bypass_cache: bool = False) -> MemoryContext:
         """Get memory context for LLM injection.
 
+        A context retrieved within the last config.context_cache_ttl seconds
+        is reused, unless messages were queued for Zep since then.
+
+        Args:
+            bypass_cache: If True, always query Zep.
+
         Returns:
             MemoryContext with summary, facts, entities, and recent messages.
         """
         if not self._initialized or not self._client:
             return MemoryContext()
 
+        if not bypass_cache:
+            await self._join_warmup()
+
+        cached = self._context_cache
+        if (
+            cached is not None
+            and not bypass_cache
+            and time.monotonic() - cached[0] < self.config.context_cache_ttl
+        ):
+            logger.debug("Reusing cached memory context")
+            return cached[1]
+        return await self._fetch_context()
+
+    async def _fetch_context(self) -> MemoryContext:
+        """Query Zep for the memory context and cache the result.
+
+        Returns:
+            The retrieved MemoryContext, or an empty one on failure.
+        """
         try:
             context = await get_context(
                 client=self._client,
@@ -454,6 +578,7 @@ class KwamiMemory:
                 include_facts=self.config.include_facts,
             )
             self._record_usage("zep/get_context")
+            self._context_cache = (time.monotonic(), context)
             return context
         except Exception as e:
             logger.error(f"Failed to get memory context: {e}")
@@ -550,6 +675,16 @@ class KwamiMemory:
         if not self._initialized or not self._client:
             return None
 
+        if await self._join_warmup():
+            return self._cached_user_name
+        return await self._lookup_user_name()
+
+    async def _lookup_user_name(self) -> Optional[str]:
+        """Search the knowledge graph for the user's name and cache it.
+
+        Returns:
+            The user's name if found, None otherwise.
+        """
         try:
             name = await get_user_name(
                 self._client, self._user_id, self.kwami_name
@@ -604,8 +739,13 @@ class KwamiMemory:
     async def close(self) -> None:
         """Close the Zep client connection.
 
-        Flushes any pending messages before closing.
+        Flushes any pending messages and waits (briefly) for the background
+        writer to finish before closing.
         """
+        for task in (self._init_task, self._warmup_task):
+            if task is not None and not task.done():
+                task.cancel()
+
         # Flush any pending user message
         if self._pending_user_message:
             try:
@@ -613,6 +753,16 @@ class KwamiMemory:
             except Exception:
                 pass
 
+        if self._writer_task is not None:
+            try:
+                await asyncio.wait_for(
+                    self._write_queue.join(), WRITE_DRAIN_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Timed out writing queued messages to memory")
+            self._writer_task.cancel()
+            self._writer_task = None
+
         if self._client:
             try:
                 await self._client.close()
@@ -674,3 +824,33 @@ async def create_memory(
         return memory
 
     return None
+
+
+def start_memory(
+    config: KwamiMemoryConfig,
+    kwami_id: str,
+    kwami_name: str = "Kwami",
+    usage_tracker=None,
+) -> Optional[KwamiMemory]:
+    """Create a KwamiMemory and initialize it in the background.
+
+    Unlike create_memory(), this returns immediately so the caller can build
+    and swap in the agent while Zep is contacted; the agent awaits
+    wait_until_ready() before first using memory.
+
+    Args:
+        config: Memory configuration.
+        kwami_id: Unique identifier for the Kwami.
+        kwami_name: Display name for the Kwami.
+
+    Returns:
+        KwamiMemory with initialization under way, or None if memory is disabled.
+    """
+    memory = KwamiMemory(config, kwami_id, kwami_name, usage_tracker=usage_tracker)
+
+    if not memory.is_enabled:
+        logger.info(f"Memory disabled for Kwami '{kwami_name}'")
+        return None
+
+    memory.start_initialize()
+    return memory
@@ -57,7 +57,7 @@ class SessionState:
         if old_agent:
             # Close old agent's voice pipeline (STT/LLM/TTS) to avoid unclosed inference connections
             cleanup_task = asyncio.create_task(
-                self._cleanup_agent_voice_pipeline(old_agent)
+                self._cleanup_agent_voice_pipeline(old_agent, keep=new_agent)
             )
             self._cleanup_tasks.append(cleanup_task)
             if old_agent._memory:
@@ -81,14 +81,17 @@ class SessionState:
 
         logger.debug(f"Agent updated, cleanup tasks pending: {len(self._cleanup_tasks)}")
     
-    async def _cleanup_agent_voice_pipeline(self, agent: Any) -> None:
+    async def _cleanup_agent_voice_pipeline(self, agent: Any, keep: Any = None) -> None:
         """Close STT/LLM/TTS connections to avoid unclosed inference connections.
         
         Args:
             agent: The agent whose pipeline to close (e.g. previous agent after reconfigure).
+            keep: Optional agent whose components are left open because they
+                were handed over to it.
         """
-        seen: set = set()
-        for name in ("stt", "llm", "tts", "_stt", "_llm", "_tts"):
+        names = ("stt", "llm", "tts", "_stt", "_llm", "_tts")
+        seen: set = {id(getattr(keep, name, None)) for name in names} if keep else set()
+        for name in names:
             obj = getattr(agent, name, None)
             if obj is None or id(obj) in seen:
                 continue
@@ -2,20 +2,21 @@
 
 import asyncio
 import json
+import math
 import os
 import re
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 from livekit.agents import RunContext, function_tool
 
+from ..browser import CloudBrowserSession
 from ..room_context import get_current_room
 from ..utils.logging import get_logger
-from ..constants import (
-    CartesiaVoices,
-    LANGUAGE_GREETINGS,
-    TTSProviders,
-)
+from ..utils.provider import build_tts_updates, is_elevenlabs_tts, resolve_cartesia_voice
+from ..constants import LANGUAGE_GREETINGS
 
 logger = get_logger("tools")
 
@@ -26,6 +27,21 @@ _PRICE_RE = re.compile(
     re.IGNORECASE,
 )
 
+_TIME_FORMAT = "%I:%M %p on %A, %B %d, %Y"
+
+MAX_GREETING_AUDIO_CACHE_ENTRIES = 32
+
+# Last formatted time as [epoch second, text]; tool bursts reuse it.
+_time_cache: List[Any] = [0, ""]
+
+
+def _format_current_time() -> str:
+    """Format the local time, reusing the result within the same second."""
+    now = int(time.time())
+    if now != _time_cache[0]:
+        _time_cache[:] = [now, datetime.now().strftime(_TIME_FORMAT)]
+    return _time_cache[1]
+
 
 def _extract_price(text: str) -> Optional[str]:
     """Extract first price-like string from text for product cards (e.g. '€199', '$49.99')."""
@@ -158,20 +174,10 @@ async def _fetch_image_for_url(
     return None
 
 
-def _is_elevenlabs_tts(tts: Any) -> bool:
-    """Check if TTS provider is ElevenLabs.
-    
-    Handles both the direct ElevenLabs plugin (livekit.plugins.elevenlabs)
-    and LiveKit Inference TTS with an ElevenLabs model (livekit.agents.inference.tts).
-    """
-    provider = getattr(tts, "provider", "").lower()
-    # Check the model string for "elevenlabs" (covers inference.TTS with elevenlabs model)
-    model = str(getattr(tts, "_model", getattr(tts, "model", ""))).lower()
-    return (
-        provider == TTSProviders.ELEVENLABS
-        or "elevenlabs" in type(tts).__module__
-        or "elevenlabs" in model
-    )
+async def _replay_frames(frames: List[Any]) -> AsyncIterator[Any]:
+    """Yield already synthesized audio frames for session.say."""
+    for frame in frames:
+        yield frame
 
 
 class AgentToolsMixin:
@@ -184,28 +190,27 @@ class AgentToolsMixin:
     - session: AgentSession with tts and stt attributes
     """
 
+    # Synthesized greeting frames shared by every agent in this worker
+    # process, so they survive agent rebuilds on config updates.
+    _greeting_audio_cache: Dict[tuple, List[Any]] = {}
+
     @function_tool()
     async def get_kwami_info(self, context: RunContext) -> Dict[str, Any]:
         """Get information about this Kwami instance."""
+        config = self.kwami_config
+        soul = {"name": config.soul.name, "personality": config.soul.personality}
         return {
-            "kwami_id": self.kwami_config.kwami_id,
-            "kwami_name": self.kwami_config.kwami_name,
-            "soul": {
-                "name": self.kwami_config.soul.name,
-                "personality": self.kwami_config.soul.personality,
-            },
+            "kwami_id": config.kwami_id,
+            "kwami_name": config.kwami_name,
+            "soul": soul,
             # Backward compatibility for older clients still reading "persona".
-            "persona": {
-                "name": self.kwami_config.soul.name,
-                "personality": self.kwami_config.soul.personality,
-            },
+            "persona": soul,
         }
 
     @function_tool()
     async def get_current_time(self, context: RunContext) -> str:
         """Get the current time. Useful when the user asks what time it is."""
-        from datetime import datetime
-        return datetime.now().strftime("%I:%M %p on %A, %B %d, %Y")
+        return _format_current_time()
 
     @function_tool()
     async def change_voice(self, context: RunContext, voice_name: str) -> str:
@@ -225,19 +230,19 @@ class AgentToolsMixin:
                 return "Unable to change voice - TTS not available"
             
             # Check if it's a known name and convert to ID
-            voice_id = CartesiaVoices.NAME_MAP.get(voice_name.lower(), voice_name)
+            voice_id = resolve_cartesia_voice(voice_name)
             
             # Different TTS providers use different parameter names
-            if _is_elevenlabs_tts(self.session.tts):
-                self.session.tts.update_options(voice_id=voice_id)
-            else:
-                self.session.tts.update_options(voice=voice_id)
+            self.session.tts.update_options(
+                **build_tts_updates(self.session.tts, voice=voice_id)
+            )
+            self._current_voice_config.tts_voice = voice_id
             
-            logger.info(f"Voice changed to: {voice_name}")
+            logger.info("Voice changed to: %s", voice_name)
             return f"Voice changed to {voice_name}. I'm now speaking with a different voice!"
             
         except Exception as e:
-            logger.error(f"Failed to change voice: {e}")
+            logger.error("Failed to change voice: %s", e)
             return f"Sorry, I couldn't change the voice: {str(e)}"
 
     @function_tool()
@@ -258,11 +263,21 @@ class AgentToolsMixin:
             speed = max(0.5, min(2.0, speed))  # Clamp to valid range
             
             # ElevenLabs TTS does not support speed option
-            if _is_elevenlabs_tts(self.session.tts):
+            if is_elevenlabs_tts(self.session.tts):
                 return "Speed adjustment is not supported with the current ElevenLabs voice provider."
             
-            self.session.tts.update_options(speed=speed)
-            logger.info(f"Speaking speed changed to: {speed}")
+            # Skip the provider reconfigure when nothing would change
+            current_speed = float(self._current_voice_config.tts_speed or 1.0)
+            if math.isclose(speed, current_speed):
+                return f"Speed is already {speed}."
+            
+            updates = build_tts_updates(self.session.tts, speed=speed)
+            if not updates:
+                return "Speed adjustment is not supported with the current voice provider."
+            
+            self.session.tts.update_options(**updates)
+            self._current_voice_config.tts_speed = speed
+            logger.info("Speaking speed changed to: %s", speed)
             
             if speed < 0.8:
                 return f"Speed set to {speed}. I'll speak more slowly now."
@@ -272,7 +287,7 @@ class AgentToolsMixin:
                 return f"Speed set to {speed}. Speaking at normal pace."
                 
         except Exception as e:
-            logger.error(f"Failed to change speed: {e}")
+            logger.error("Failed to change speed: %s", e)
             return f"Sorry, I couldn't change the speed: {str(e)}"
 
     @function_tool()
@@ -288,27 +303,71 @@ class AgentToolsMixin:
             if not hasattr(self, "session") or self.session is None:
                 return f"Language preference noted: {language}"
             
-            language = language.lower().strip()
+            language = language.strip().casefold()
+            session = self.session
+            tts = session.tts
             
-            # Update STT language
-            if self.session.stt is not None:
-                self.session.stt.update_options(language=language)
-                logger.info(f"STT language changed to: {language}")
+            # Update STT language (update_options only stores options for the
+            # next stream, so there is no I/O to overlap with the TTS update)
+            if session.stt is not None:
+                session.stt.update_options(language=language)
+                self._current_voice_config.stt_language = language
+                logger.info("STT language changed to: %s", language)
             
             # Update TTS language if supported
-            if self.session.tts is not None:
+            if tts is not None:
                 try:
-                    self.session.tts.update_options(language=language)
-                    logger.info(f"TTS language changed to: {language}")
+                    tts.update_options(language=language)
+                    logger.info("TTS language changed to: %s", language)
                 except Exception:
                     pass  # Not all TTS providers support language parameter
             
-            return LANGUAGE_GREETINGS.get(language, f"Language changed to {language}.")
+            greeting = LANGUAGE_GREETINGS.get(language)
+            if greeting is None or tts is None:
+                return greeting or f"Language changed to {language}."
+            
+            # Speak the fixed greeting directly; its audio is reused on later
+            # switches. Synthesize first so a TTS failure leaves it to the LLM.
+            try:
+                frames = await self._greeting_audio(language, greeting)
+            except Exception as e:
+                logger.warning("Could not synthesize %s greeting: %s", language, e)
+                return greeting
+            session.say(greeting, audio=_replay_frames(frames))
+            return (
+                f"Language changed to {language}. You already greeted the user with "
+                f"'{greeting}', so continue in this language without repeating it."
+            )
             
         except Exception as e:
-            logger.error(f"Failed to change language: {e}")
+            logger.error("Failed to change language: %s", e)
             return f"Sorry, I couldn't change the language: {str(e)}"
 
+    async def _greeting_audio(self, language: str, text: str) -> List[Any]:
+        """Return audio frames for a language greeting in the current voice.
+        
+        The first request synthesizes the frames; they are cached so later
+        switches replay them without calling the TTS.
+        """
+        voice = self._current_voice_config
+        key = (
+            language, text, voice.tts_provider, voice.tts_model, voice.tts_voice, voice.tts_speed
+        )
+        cached = self._greeting_audio_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        frames = []
+        async with self.session.tts.synthesize(text) as stream:
+            async for audio in stream:
+                frames.append(audio.frame)
+        if not frames:
+            raise RuntimeError("TTS produced no audio")
+        if len(self._greeting_audio_cache) >= MAX_GREETING_AUDIO_CACHE_ENTRIES:
+            self._greeting_audio_cache.clear()
+        self._greeting_audio_cache[key] = frames
+        return frames
+
     @function_tool()
     async def get_current_voice_settings(self, context: RunContext) -> Dict[str, Any]:
         """Get the current voice pipeline settings."""
@@ -334,10 +393,10 @@ class AgentToolsMixin:
         
         try:
             await self._memory.add_fact(fact)
-            logger.info(f"Remembered fact: {fact}")
+            logger.info("Remembered fact: %s", fact)
             return f"I'll remember that: {fact}"
         except Exception as e:
-            logger.error(f"Failed to remember fact: {e}")
+            logger.error("Failed to remember fact: %s", e)
             return "Sorry, I couldn't save that to memory."
 
     @function_tool()
@@ -352,17 +411,13 @@ class AgentToolsMixin:
             if not results:
                 return f"I don't have any memories about '{topic}' yet."
             
-            memories = []
-            for r in results:
-                if r.get("content"):
-                    memories.append(f"- {r['content']}")
-            
-            if memories:
-                return f"Here's what I remember about '{topic}':\n" + "\n".join(memories)
+            body = "\n".join(f"- {r['content']}" for r in results if r.get("content"))
+            if body:
+                return f"Here's what I remember about '{topic}':\n{body}"
             return f"I don't have specific memories about '{topic}'."
             
         except Exception as e:
-            logger.error(f"Failed to recall memories: {e}")
+            logger.error("Failed to recall memories: %s", e)
             return "Sorry, I couldn't search my memory right now."
 
     @function_tool()
@@ -681,8 +736,6 @@ class AgentToolsMixin:
 
     async def _get_browser_session(self):
         """Get or create the cloud browser session for this agent."""
-        from ..browser import CloudBrowserSession
-
         if not hasattr(self, "_browser_session") or self._browser_session is None:
             room = get_current_room() or self.room
             self._browser_session = CloudBrowserSession(room=room)
@@ -1,20 +1,75 @@
 """Client-side tool management for Kwami agent."""
 
 import asyncio
+import itertools
 import json
-import uuid
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import secrets
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from livekit.agents import RunContext, function_tool
 
 from ..room_context import get_current_room
 from ..utils.logging import get_logger
+from ..utils.serialization import MSGPACK_TOPIC_SUFFIX, pack
+from ..utils.serialization import dumps as json_dumps
 from ..utils.validation import validate_tool_definition
 
 if TYPE_CHECKING:
     from ..agent import KwamiAgent
 
 logger = get_logger("client_tools")
+MAX_SCHEMA_CACHE_ENTRIES = 32
+TOOL_CALL_TIMEOUT_SECONDS = 30.0
+TOOL_CALL_TIMEOUT_RESULT = "Error: Tool execution timed out"
+# How long parallel tool calls are collected before being published together
+TOOL_CALL_BATCH_WINDOW_SECONDS = 0.002
+# Topic for tool calls published as MessagePack
+TOOL_CALL_MSGPACK_TOPIC = "tool_call" + MSGPACK_TOPIC_SUFFIX
+
+# Validated (definition, raw_schema) pairs keyed by the canonical JSON of a
+# tool definition list, shared by every agent rebuilt from the same config.
+_schema_cache: Dict[str, List[Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
+
+# Parameters schema shared by every tool that declares none (treat as read-only)
+_EMPTY_PARAMETERS: Dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+
+
+def _build_raw_schemas(
+    tool_definitions: List[Dict[str, Any]],
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Validate tool definitions and build their raw schemas, reusing cached results.
+    
+    Args:
+        tool_definitions: List of tool definition dictionaries.
+        
+    Returns:
+        List of (tool definition, raw schema) pairs for the valid definitions.
+    """
+    cache_key = json.dumps(tool_definitions, sort_keys=True, default=str)
+    cached = _schema_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    schemas = []
+    for tool_def in tool_definitions:
+        # Validate tool definition
+        if not validate_tool_definition(tool_def):
+            continue
+
+        # Handle different formats
+        func_def = tool_def.get("function", tool_def)
+        parameters = func_def.get("parameters", {})
+        schemas.append((tool_def, {
+            "type": "function",
+            "name": func_def.get("name"),
+            "description": func_def.get("description", ""),
+            "parameters": parameters or _EMPTY_PARAMETERS,
+        }))
+
+    if len(_schema_cache) >= MAX_SCHEMA_CACHE_ENTRIES:
+        _schema_cache.clear()
+    _schema_cache[cache_key] = schemas
+    return schemas
 
 
 class ClientToolManager:
@@ -26,16 +81,33 @@ class ClientToolManager:
     - Handling tool results from the client
     """
 
-    def __init__(self, kwami_agent: "KwamiAgent"):
+    def __init__(
+        self,
+        kwami_agent: "KwamiAgent",
+        batch_tool_calls: bool = False,
+        msgpack_tool_calls: bool = False,
+    ):
         """Initialize the client tool manager.
         
         Args:
             kwami_agent: The KwamiAgent instance (needed to access the room for sending data)
+            batch_tool_calls: If True, tool calls issued within a short window are
+                published together in one "tool_calls_batch" envelope.
+            msgpack_tool_calls: If True, tool calls are published as MessagePack
+                on the "tool_call.mp" topic instead of JSON.
         """
         self.agent = kwami_agent
         self.pending_calls: Dict[str, asyncio.Future] = {}
         self.registered_tools: List[Dict[str, Any]] = []
         self._tools: List[Any] = []
+        # Call IDs only need to be unique per manager; the random prefix keeps
+        # late results for a replaced agent from matching this one's calls.
+        self._id_prefix = secrets.token_urlsafe(4)
+        self._id_counter = itertools.count()
+        self.batch_tool_calls = batch_tool_calls
+        self.msgpack_tool_calls = msgpack_tool_calls
+        self._pending_publish: List[Dict[str, Any]] = []
+        self._publish_task: Optional[asyncio.Task] = None
 
     def register_client_tools(self, tool_definitions: List[Dict[str, Any]]) -> None:
         """Register tools defined in configuration for the LLM.
@@ -46,63 +118,44 @@ class ClientToolManager:
         if not tool_definitions:
             return
 
-        for tool_def in tool_definitions:
-            # Validate tool definition
-            if not validate_tool_definition(tool_def):
-                continue
-            
-            # Handle different formats
-            func_def = tool_def.get("function", tool_def)
-            tool_name = func_def.get("name")
-            description = func_def.get("description", "")
-            parameters = func_def.get("parameters", {})
-
-            logger.info(f"Registering client tool: {tool_name}")
+        for tool_def, raw_schema in _build_raw_schemas(tool_definitions):
+            logger.info(f"Registering client tool: {raw_schema['name']}")
 
             # Create the tool using function_tool with raw_schema
-            tool = self._create_client_tool(tool_name, description, parameters)
+            tool = self._create_client_tool(raw_schema)
             self._tools.append(tool)
             self.registered_tools.append(tool_def)
 
-    def _create_client_tool(
-        self,
-        tool_name: str,
-        description: str,
-        parameters: dict,
-    ) -> Any:
+    def _create_client_tool(self, raw_schema: Dict[str, Any]) -> Any:
         """Create a function tool that forwards calls to the client.
         
         Args:
-            tool_name: The name of the tool.
-            description: Tool description for the LLM.
-            parameters: JSON schema for tool parameters.
+            raw_schema: Prebuilt function schema (name, description, parameters).
             
         Returns:
             A function_tool decorated handler.
         """
-        # Build the raw schema for the tool
-        raw_schema = {
-            "type": "function",
-            "name": tool_name,
-            "description": description,
-            "parameters": parameters if parameters else {
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        }
+        tool_name = raw_schema["name"]
+        # Bind manager state once so each call reads locals, not attributes
+        agent = self.agent
+        pending_calls = self.pending_calls
+        id_prefix = self._id_prefix
+        id_counter = self._id_counter
+        batch_tool_calls = self.batch_tool_calls
 
         # Create the handler function that will be called when the tool is invoked
         async def tool_handler(raw_arguments: dict, context: RunContext) -> str:
-            tool_call_id = str(uuid.uuid4())
+            tool_call_id = f"{id_prefix}-{next(id_counter)}"
+            # Serialize the arguments once; the same string is logged and sent
+            arguments = json_dumps(raw_arguments).decode("utf-8")
             logger.info(
-                f"Calling client tool '{tool_name}' (id: {tool_call_id}) args: {raw_arguments}"
+                "Calling client tool '%s' (id: %s) args: %s", tool_name, tool_call_id, arguments
             )
 
             room = (
                 get_current_room()
                 or (getattr(context, "room", None) if context else None)
-                or getattr(self.agent, "room", None)
+                or getattr(agent, "room", None)
             )
 
             # Check room connection
@@ -112,42 +165,93 @@ class ClientToolManager:
                     "(current_room=%s, context_room=%s, agent_room=%s)",
                     get_current_room() is not None,
                     getattr(context, "room", None) is not None if context else False,
-                    getattr(self.agent, "room", None) is not None,
+                    getattr(agent, "room", None) is not None,
                 )
                 return "Error: Agent not connected to room"
 
-            result_future: asyncio.Future = asyncio.Future()
-            self.pending_calls[tool_call_id] = result_future
+            loop = asyncio.get_running_loop()
+            result_future = loop.create_future()
+            pending_calls[tool_call_id] = result_future
 
             payload = {
                 "type": "tool_call",
                 "toolCallId": tool_call_id,
                 "function": {
                     "name": tool_name,
-                    "arguments": json.dumps(raw_arguments),
+                    "arguments": arguments,
                 },
             }
 
-            try:
-                data = json.dumps(payload).encode("utf-8")
-                await room.local_participant.publish_data(data, reliable=True)
+            def expire() -> None:
+                if not result_future.done():
+                    logger.warning("Tool call timed out: %s (%s)", tool_name, tool_call_id)
+                    result_future.set_result(TOOL_CALL_TIMEOUT_RESULT)
 
-                try:
-                    result = await asyncio.wait_for(result_future, timeout=30.0)
-                    return result
-                except asyncio.TimeoutError:
-                    logger.warning(f"Tool call timed out: {tool_name} ({tool_call_id})")
-                    return "Error: Tool execution timed out"
+            # Resolve the future from a timer instead of wrapping it in wait_for
+            timeout_handle = loop.call_later(TOOL_CALL_TIMEOUT_SECONDS, expire)
+            try:
+                if batch_tool_calls:
+                    await self._publish_batched(room, payload)
+                else:
+                    await self._publish(room, payload)
+                return await result_future
 
             except Exception as e:
                 logger.error(f"Error executing client tool: {e}")
                 return f"Error executing tool: {str(e)}"
             finally:
-                self.pending_calls.pop(tool_call_id, None)
+                timeout_handle.cancel()
+                pending_calls.pop(tool_call_id, None)
 
         # Create the function tool using the raw_schema approach
         return function_tool(tool_handler, raw_schema=raw_schema)
 
+    async def _publish_batched(self, room: Any, payload: Dict[str, Any]) -> None:
+        """Queue a tool call and wait for the publish that carries it.
+        
+        Args:
+            room: The LiveKit room to publish on.
+            payload: The tool call envelope.
+        """
+        self._pending_publish.append(payload)
+        if self._publish_task is None:
+            self._publish_task = asyncio.create_task(self._flush_publish(room))
+        # Shield so one cancelled tool call doesn't drop the others in its batch
+        await asyncio.shield(self._publish_task)
+
+    async def _flush_publish(self, room: Any) -> None:
+        """Publish every tool call queued during the batch window in one packet.
+        
+        A lone call is sent as a plain "tool_call" envelope, so clients only
+        see "tool_calls_batch" when calls were actually issued in parallel.
+        
+        Args:
+            room: The LiveKit room to publish on.
+        """
+        await asyncio.sleep(TOOL_CALL_BATCH_WINDOW_SECONDS)
+        calls, self._pending_publish = self._pending_publish, []
+        # Calls queued from here on start a new batch
+        self._publish_task = None
+
+        if len(calls) == 1:
+            await self._publish(room, calls[0])
+        else:
+            await self._publish(room, {"type": "tool_calls_batch", "calls": calls})
+
+    async def _publish(self, room: Any, payload: Dict[str, Any]) -> None:
+        """Publish a tool call envelope in the format the client asked for.
+        
+        Args:
+            room: The LiveKit room to publish on.
+            payload: The envelope to send.
+        """
+        if self.msgpack_tool_calls:
+            await room.local_participant.publish_data(
+                pack(payload), reliable=True, topic=TOOL_CALL_MSGPACK_TOPIC
+            )
+        else:
+            await room.local_participant.publish_data(json_dumps(payload), reliable=True)
+
     def handle_tool_result(
         self,
         tool_call_id: str,
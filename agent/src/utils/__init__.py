@@ -6,6 +6,10 @@ from .provider import (
     detect_tts_provider_from_model,
     detect_tts_provider_from_voice,
     detect_provider_change,
+    is_inference_tts,
+    is_elevenlabs_tts,
+    build_tts_updates,
+    resolve_cartesia_voice,
 )
 from .room import get_other_agents, should_disconnect_as_duplicate
 from .validation import validate_tool_definition, normalize_config_keys
@@ -17,6 +21,10 @@ __all__ = [
     "detect_tts_provider_from_model",
     "detect_tts_provider_from_voice",
     "detect_provider_change",
+    "is_inference_tts",
+    "is_elevenlabs_tts",
+    "build_tts_updates",
+    "resolve_cartesia_voice",
     "get_other_agents",
     "should_disconnect_as_duplicate",
     "validate_tool_definition",
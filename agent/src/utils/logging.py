@@ -1,7 +1,6 @@
 """Consistent logging utilities for Kwami agent."""
 
 import logging
-import traceback
 from typing import Optional
 
 # Single logger name for the entire agent
@@ -37,8 +36,12 @@ def log_error(
         error: The exception that occurred.
         include_traceback: Whether to include full traceback.
     """
-    if include_traceback:
-        tb = traceback.format_exc()
-        logger.error(f"{message}: {type(error).__name__}: {error}\n{tb}")
-    else:
-        logger.error(f"{message}: {type(error).__name__}: {error}")
+    # Formatting (and traceback rendering) is left to the handler, so nothing
+    # is built if the record is filtered out
+    logger.error(
+        "%s: %s: %s",
+        message,
+        type(error).__name__,
+        error,
+        exc_info=error if include_traceback else None,
+    )
@@ -1,13 +1,37 @@
 """Provider detection utilities for TTS/LLM switching."""
 
-from typing import Optional, Tuple
+import functools
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from ..constants import CartesiaVoices
 
 # OpenAI TTS voice names
-OPENAI_VOICES = {"alloy", "ash", "coral", "echo", "fable", "nova", "onyx", "sage", "shimmer"}
+OPENAI_VOICES = frozenset({"alloy", "ash", "coral", "echo", "fable", "nova", "onyx", "sage", "shimmer"})
 
 # Known provider prefixes for model names
 KNOWN_PROVIDERS = ("elevenlabs", "openai", "cartesia", "deepgram", "google", "anthropic", "groq", "deepseek", "mistral", "cerebras")
 
+# TTS providers accepted as an explicit "<provider>/" model prefix
+_TTS_MODEL_PREFIX_PROVIDERS = frozenset({"elevenlabs", "openai", "cartesia", "deepgram", "google", "rime"})
+
+# TTS model name prefixes per provider, checked in order
+_TTS_MODEL_PATTERNS = (
+    (("eleven_", "eleven-"), "elevenlabs"),
+    (("tts-", "gpt-4o"), "openai"),
+    (("sonic",), "cartesia"),
+    (("aura",), "deepgram"),
+    (("arcana", "mistv"), "rime"),
+)
+
+# ElevenLabs: 20+ char alphanumeric IDs (e.g., "JBFqnCBsd6RMkjVDRZzb")
+_ELEVENLABS_VOICE_RE = re.compile(r"[A-Za-z0-9]{20,}")
+
+# Cartesia: UUID format (e.g., "79a125e8-cd45-4c13-8a67-188112f4dd22")
+_CARTESIA_VOICE_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
 
 def strip_model_prefix(model: str, provider: str) -> str:
     """Strip provider prefix from model name if present.
@@ -31,6 +55,18 @@ def strip_model_prefix(model: str, provider: str) -> str:
     return model
 
 
+def resolve_cartesia_voice(voice: str) -> str:
+    """Map a friendly Cartesia voice name to its voice ID.
+    
+    Args:
+        voice: Friendly name (any case) or an existing voice ID.
+        
+    Returns:
+        The mapped voice ID, or the input unchanged if it is not a known name.
+    """
+    return CartesiaVoices.NAME_MAP.get(voice.casefold(), voice)
+
+
 def detect_tts_provider_from_model(model: str) -> Optional[str]:
     """Detect TTS provider based on model name.
     
@@ -46,25 +82,14 @@ def detect_tts_provider_from_model(model: str) -> Optional[str]:
     model_lower = model.lower()
     
     # Check explicit provider prefix first (e.g. "elevenlabs/eleven-flash-v2.5")
-    for provider in ("elevenlabs", "openai", "cartesia", "deepgram", "google", "rime"):
-        if model_lower.startswith(f"{provider}/"):
-            return provider
+    prefix, sep, _ = model_lower.partition("/")
+    if sep and prefix in _TTS_MODEL_PREFIX_PROVIDERS:
+        return prefix
     
     # Then check model name patterns
-    if model_lower.startswith("eleven_") or model_lower.startswith("eleven-"):
-        return "elevenlabs"
-    
-    if model_lower.startswith("tts-") or model_lower.startswith("gpt-4o"):
-        return "openai"
-    
-    if model_lower.startswith("sonic"):
-        return "cartesia"
-    
-    if model_lower.startswith("aura"):
-        return "deepgram"
-    
-    if model_lower.startswith("arcana") or model_lower.startswith("mistv"):
-        return "rime"
+    for prefixes, provider in _TTS_MODEL_PATTERNS:
+        if model_lower.startswith(prefixes):
+            return provider
     
     return None
 
@@ -81,13 +106,12 @@ def detect_tts_provider_from_voice(voice: str) -> Optional[str]:
     if not voice:
         return None
     
-    # ElevenLabs: 20+ char alphanumeric IDs (e.g., "JBFqnCBsd6RMkjVDRZzb")
-    if len(voice) >= 20 and voice.isalnum():
-        return "elevenlabs"
-    
-    # Cartesia: UUID format (e.g., "79a125e8-cd45-4c13-8a67-188112f4dd22")
-    if len(voice) == 36 and voice.count("-") == 4:
-        return "cartesia"
+    # Both ID formats are long; short names skip the regexes entirely
+    if len(voice) >= 20:
+        if _ELEVENLABS_VOICE_RE.fullmatch(voice):
+            return "elevenlabs"
+        if _CARTESIA_VOICE_RE.fullmatch(voice):
+            return "cartesia"
     
     # OpenAI: Short lowercase names
     if voice.lower() in OPENAI_VOICES:
@@ -127,3 +151,58 @@ def detect_provider_change(
     
     has_changed = detected_provider != current_provider
     return detected_provider, has_changed
+
+
+@functools.lru_cache(maxsize=64)
+def _module_mentions(cls: type, name: str) -> bool:
+    """Check whether a class's module path contains a name, once per class."""
+    return name in cls.__module__
+
+
+def is_inference_tts(tts: Any) -> bool:
+    """Check if a TTS instance is served through LiveKit Inference."""
+    return _module_mentions(type(tts), "inference")
+
+
+def is_elevenlabs_tts(tts: Any) -> bool:
+    """Check if a TTS instance is ElevenLabs.
+    
+    Handles both the direct ElevenLabs plugin (livekit.plugins.elevenlabs)
+    and LiveKit Inference TTS with an ElevenLabs model (livekit.agents.inference.tts).
+    """
+    provider = str(getattr(tts, "provider", "") or "").lower()
+    model = str(getattr(tts, "_model", getattr(tts, "model", ""))).lower()
+    return (
+        provider == "elevenlabs"
+        or _module_mentions(type(tts), "elevenlabs")
+        or "elevenlabs" in model
+    )
+
+
+def build_tts_updates(
+    tts: Any,
+    voice: Optional[str] = None,
+    speed: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Map voice/speed changes to the update_options kwargs a TTS accepts.
+    
+    inference.TTS (used for ElevenLabs, Rime via LiveKit Inference) always
+    uses "voice" and does not support speed; only the direct elevenlabs.TTS
+    plugin uses "voice_id".
+    
+    Args:
+        tts: The TTS instance that will receive the update.
+        voice: New voice ID or name, if changing.
+        speed: New speed multiplier, if changing.
+        
+    Returns:
+        Keyword arguments for tts.update_options (empty if nothing applies).
+    """
+    updates: Dict[str, Any] = {}
+    inference = is_inference_tts(tts)
+    if voice:
+        key = "voice_id" if not inference and is_elevenlabs_tts(tts) else "voice"
+        updates[key] = voice
+    if speed is not None and not inference:
+        updates["speed"] = float(speed)
+    return updates
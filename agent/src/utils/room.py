@@ -1,8 +1,11 @@
 """Room and participant utilities for Kwami agent."""
 
 import asyncio
+from operator import attrgetter
 from typing import TYPE_CHECKING, List, Optional
 
+from livekit.rtc import ParticipantKind
+
 from .logging import get_logger
 
 if TYPE_CHECKING:
@@ -20,14 +23,54 @@ async def get_other_agents(room: "Room") -> List["Participant"]:
     Returns:
         List of participants that are agents.
     """
-    from livekit.rtc import ParticipantKind
-    
     return [
         p for p in room.remote_participants.values()
         if p.kind == ParticipantKind.AGENT
     ]
 
 
+def _oldest_agent(room: "Room", connected_only: bool = False) -> Optional["Participant"]:
+    """Return the agent participant with the smallest identity in one pass.
+    
+    Args:
+        room: The LiveKit room instance.
+        connected_only: If True, ignore agents that are not connected.
+        
+    Returns:
+        The agent that has priority, or None if there is none.
+    """
+    return min(
+        (
+            p for p in room.remote_participants.values()
+            if p.kind == ParticipantKind.AGENT and (p.is_connected or not connected_only)
+        ),
+        key=attrgetter("identity"),
+        default=None,
+    )
+
+
+async def _wait_for_agent_join(room: "Room", timeout: float) -> None:
+    """Wait until another agent joins the room or the timeout expires.
+    
+    Args:
+        room: The LiveKit room instance.
+        timeout: Maximum time to wait in seconds.
+    """
+    joined = asyncio.Event()
+
+    def on_participant_connected(participant: "Participant") -> None:
+        if participant.kind == ParticipantKind.AGENT:
+            joined.set()
+
+    room.on("participant_connected", on_participant_connected)
+    try:
+        await asyncio.wait_for(joined.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        room.off("participant_connected", on_participant_connected)
+
+
 async def should_disconnect_as_duplicate(
     room: "Room",
     my_identity: str,
@@ -51,33 +94,30 @@ async def should_disconnect_as_duplicate(
     if check_delays is None:
         check_delays = [0.1]
     
+    if not my_identity:
+        return False
+    
     for delay in check_delays:
-        await asyncio.sleep(delay)
+        oldest_agent = _oldest_agent(room, connected_only=True)
+        if oldest_agent is None:
+            # Give late joiners a moment; returns as soon as an agent connects
+            await _wait_for_agent_join(room, delay)
+            oldest_agent = _oldest_agent(room, connected_only=True)
+            if oldest_agent is None:
+                continue
         
-        other_agents = await get_other_agents(room)
-        
-        if other_agents:
-            # Filter out agents that might be disconnecting (check if connected)
-            active_agents = [a for a in other_agents if a.is_connected]
-            
-            if not active_agents:
-                logger.debug("Found agents but none are actively connected, proceeding")
-                return False
-            
-            # The agent with the "smaller" identity stays
-            oldest_agent = min(active_agents, key=lambda p: p.identity)
-            
-            if my_identity > oldest_agent.identity:
-                logger.warning(
-                    f"Another active agent ({oldest_agent.identity}) has priority. "
-                    f"This agent ({my_identity}) should disconnect."
-                )
-                return True
-            else:
-                logger.info(
-                    f"This agent ({my_identity}) has priority over {oldest_agent.identity}"
-                )
-                return False
+        # The agent with the "smaller" identity stays
+        if my_identity > oldest_agent.identity:
+            logger.warning(
+                f"Another active agent ({oldest_agent.identity}) has priority. "
+                f"This agent ({my_identity}) should disconnect."
+            )
+            return True
+        else:
+            logger.info(
+                f"This agent ({my_identity}) has priority over {oldest_agent.identity}"
+            )
+            return False
     
     return False
 
@@ -98,16 +138,13 @@ async def check_duplicate_before_action(
     if not room:
         return False
     
-    other_agents = await get_other_agents(room)
-    
-    if not other_agents:
+    oldest = _oldest_agent(room)
+    if oldest is None:
         return False
     
     if not my_identity:
         my_identity = room.local_participant.identity if room.local_participant else ""
     
-    oldest = min(other_agents, key=lambda p: p.identity)
-    
     if my_identity > oldest.identity:
         logger.warning(f"Aborting action - another agent ({oldest.identity}) has priority")
         return True
@@ -0,0 +1,99 @@
+"""Serialization helpers for data channel payloads.
+
+JSON goes through orjson (parses bytes directly, no decode step). Packets
+published on a MessagePack topic (".mp" suffix) are encoded with msgpack.
+"""
+
+from typing import Any, Optional, Union
+
+import msgpack
+import orjson
+
+# Data packets whose topic ends with this suffix carry MessagePack, not JSON
+MSGPACK_TOPIC_SUFFIX = ".mp"
+
+# Largest data packet treated as a Kwami message; bigger payloads are ignored
+MAX_MESSAGE_BYTES = 64_000
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str.
+    
+    Args:
+        data: UTF-8 encoded JSON bytes or a JSON string.
+        
+    Returns:
+        The decoded Python object.
+        
+    Raises:
+        ValueError: If the payload is not valid JSON.
+    """
+    return orjson.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes.
+    
+    Args:
+        obj: JSON-serializable object.
+        
+    Returns:
+        The encoded JSON document.
+        
+    Raises:
+        TypeError: If the object is not JSON serializable.
+    """
+    return orjson.dumps(obj)
+
+
+def pack(obj: Any) -> bytes:
+    """Serialize an object to MessagePack bytes.
+    
+    Args:
+        obj: MessagePack-serializable object.
+        
+    Returns:
+        The encoded MessagePack document.
+        
+    Raises:
+        TypeError: If the object is not serializable.
+    """
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def is_message_packet(data: bytes, topic: Optional[str] = None) -> bool:
+    """Cheaply check whether a data packet can be a Kwami message.
+    
+    JSON messages are always objects, so anything not starting with "{" (or
+    not on a MessagePack topic) is some other application's data and can be
+    skipped without decoding it.
+    
+    Args:
+        data: Raw packet payload.
+        topic: Packet topic.
+        
+    Returns:
+        True if the packet should be decoded.
+    """
+    if not data or len(data) > MAX_MESSAGE_BYTES:
+        return False
+    return data[0] == 0x7B or bool(topic and topic.endswith(MSGPACK_TOPIC_SUFFIX))
+
+
+def decode_packet(data: bytes, topic: Optional[str] = None) -> Any:
+    """Decode a data channel packet using the format implied by its topic.
+    
+    Args:
+        data: Raw packet payload.
+        topic: Packet topic; a MessagePack topic (e.g. "tool_result.mp")
+            selects MessagePack, anything else is parsed as JSON.
+        
+    Returns:
+        The decoded Python object.
+        
+    Raises:
+        ValueError: If the payload cannot be decoded.
+    """
+    if topic and topic.endswith(MSGPACK_TOPIC_SUFFIX):
+        return msgpack.unpackb(data, raw=False)
+    return loads(data)
@@ -10,6 +10,7 @@ mock_modules = [
     "livekit",
     "livekit.agents",
     "livekit.agents.inference",
+    "livekit.rtc",
     "livekit.plugins",
     "livekit.plugins.openai",
     "livekit.plugins.deepgram",
@@ -0,0 +1,126 @@
+"""Unit tests for KwamiAgent prompt building."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+# Note: livekit mocking is done in conftest.py
+from src.agent import KwamiAgent
+from src.config import KwamiConfig, KwamiSoulConfig
+
+
+def _make_agent(soul: KwamiSoulConfig) -> KwamiAgent:
+    """Create an agent without running the LiveKit Agent constructor."""
+    agent = KwamiAgent.__new__(KwamiAgent)
+    agent.kwami_config = KwamiConfig(soul=soul)
+    return agent
+
+
+class TestSystemPrompt(unittest.TestCase):
+
+    def setUp(self):
+        KwamiAgent._prompt_cache.clear()
+
+    def test_soul_prompt_is_cached(self):
+        """Test identical souls reuse the same prompt string."""
+        first = _make_agent(KwamiSoulConfig(name="Nova", traits=["kind"]))
+        second = _make_agent(KwamiSoulConfig(name="Nova", traits=["kind"]))
+
+        prompt = first._build_system_prompt()
+
+        self.assertIs(second._build_system_prompt(), prompt)
+        self.assertEqual(len(KwamiAgent._prompt_cache), 1)
+
+    def test_soul_change_rebuilds_prompt(self):
+        """Test changing a soul field produces a new prompt."""
+        agent = _make_agent(KwamiSoulConfig(name="Nova"))
+        before = agent._build_system_prompt()
+
+        agent.kwami_config.soul.emotional_traits = {"empathy": 80}
+        after = agent._build_system_prompt()
+
+        self.assertNotEqual(before, after)
+        self.assertIn("Voice emotion profile", after)
+
+    def test_different_souls_share_guidance_prefix(self):
+        """Test persona text comes after the shared fixed guidance."""
+        nova = _make_agent(KwamiSoulConfig(name="Nova"))._build_system_prompt()
+        zed = _make_agent(KwamiSoulConfig(name="Zed"))._build_system_prompt()
+
+        self.assertTrue(nova.startswith("You are interacting via voice."))
+        self.assertEqual(nova[:nova.index("Nova")], zed[:zed.index("Zed")])
+
+    def test_memory_context_is_appended(self):
+        """Test memory context is added after the cached soul prefix."""
+        agent = _make_agent(KwamiSoulConfig())
+        base = agent._build_system_prompt()
+
+        prompt = agent._build_system_prompt("User likes tea.")
+
+        self.assertTrue(prompt.startswith(base))
+        self.assertTrue(prompt.endswith("User likes tea."))
+        self.assertIn("## Your Memory", prompt)
+
+
+class TestInjectMemoryContext(unittest.IsolatedAsyncioTestCase):
+
+    def _make_agent(self) -> KwamiAgent:
+        agent = _make_agent(KwamiSoulConfig())
+        context = MagicMock()
+        context.to_system_prompt_addition.return_value = "User likes tea."
+        agent._memory = MagicMock(
+            is_initialized=True,
+            wait_until_ready=AsyncMock(return_value=True),
+            get_user_name=AsyncMock(return_value=None),
+            get_context=AsyncMock(return_value=context),
+        )
+        agent.update_instructions = AsyncMock()
+        return agent
+
+    async def test_new_memory_updates_instructions(self):
+        """Test fresh memory context is pushed to the LLM."""
+        agent = self._make_agent()
+        agent.instructions = agent._build_system_prompt()
+
+        await agent._inject_memory_context()
+
+        agent.update_instructions.assert_awaited_once_with(
+            agent._build_system_prompt("User likes tea.")
+        )
+
+    async def test_unchanged_prompt_is_not_resent(self):
+        """Test an agent that inherited the same memory prompt skips the update."""
+        agent = self._make_agent()
+        agent.instructions = agent._build_system_prompt("User likes tea.")
+
+        await agent._inject_memory_context()
+
+        agent.update_instructions.assert_not_awaited()
+
+
+class TestExtractMessageContent(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = _make_agent(KwamiSoulConfig())
+
+    def test_string_and_text_attributes(self):
+        """Test plain strings and objects with a text attribute."""
+        self.assertEqual(self.agent._extract_message_content("  hi  "), "hi")
+        self.assertEqual(self.agent._extract_message_content(SimpleNamespace(text=" hey ")), "hey")
+
+    def test_chat_message_text_content(self):
+        """Test list content falls through to the text_content property."""
+        message = SimpleNamespace(content=["hello"], text_content="hello")
+
+        self.assertEqual(self.agent._extract_message_content(message), "hello")
+
+    def test_default_repr_is_not_built(self):
+        """Test objects with the default repr yield nothing, custom __str__ still works."""
+        custom = type("Custom", (), {"__str__": lambda self: " custom "})
+
+        self.assertEqual(self.agent._extract_message_content(object()), "")
+        self.assertEqual(self.agent._extract_message_content(custom()), "custom")
+
+
+if __name__ == "__main__":
+    unittest.main()
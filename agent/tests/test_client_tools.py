@@ -0,0 +1,129 @@
+"""Unit tests for client tool schemas and call handling."""
+
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+# Note: livekit mocking is done in conftest.py
+from src.tools import client
+from src.tools.client import ClientToolManager, _build_raw_schemas, _schema_cache
+from src.utils.serialization import decode_packet
+
+
+def _make_handler(manager: ClientToolManager, name: str = "open_panel"):
+    """Create a client tool and return its undecorated handler."""
+    with patch.object(client, "function_tool", lambda fn, raw_schema: fn):
+        return manager._create_client_tool({"name": name})
+
+
+class TestBuildRawSchemas(unittest.TestCase):
+
+    def setUp(self):
+        _schema_cache.clear()
+
+    def test_invalid_definitions_are_skipped(self):
+        """Test definitions without a name produce no schema."""
+        schemas = _build_raw_schemas([
+            {"name": "open_panel", "description": "Open a panel"},
+            {"description": "missing name"},
+        ])
+
+        self.assertEqual([schema["name"] for _, schema in schemas], ["open_panel"])
+        self.assertEqual(schemas[0][1]["parameters"]["type"], "object")
+
+    def test_equal_definitions_reuse_schemas(self):
+        """Test rebuilding from an equal tool list reuses the same schemas."""
+        first = _build_raw_schemas([{"function": {"name": "a", "parameters": {}}}])
+        second = _build_raw_schemas([{"function": {"parameters": {}, "name": "a"}}])
+
+        self.assertIs(first, second)
+
+
+class TestToolHandler(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        publish = AsyncMock()
+        self.room = SimpleNamespace(local_participant=SimpleNamespace(publish_data=publish))
+        self.manager = ClientToolManager(SimpleNamespace(room=self.room))
+        self.handler = _make_handler(self.manager)
+
+    async def test_result_from_client(self):
+        """Test the handler returns the result delivered for its call ID."""
+        def deliver(data, reliable):
+            call_id = next(iter(self.manager.pending_calls))
+            self.manager.handle_tool_result(call_id, "done")
+
+        self.room.local_participant.publish_data.side_effect = deliver
+
+        with patch.object(client, "get_current_room", return_value=None):
+            self.assertEqual(await self.handler({}, None), "done")
+        self.assertEqual(self.manager.pending_calls, {})
+
+    async def test_timeout(self):
+        """Test the handler resolves with a timeout error when no result arrives."""
+        with patch.object(client, "get_current_room", return_value=None), \
+                patch.object(client, "TOOL_CALL_TIMEOUT_SECONDS", 0.01):
+            result = await self.handler({}, None)
+
+        self.assertEqual(result, client.TOOL_CALL_TIMEOUT_RESULT)
+        self.assertEqual(self.manager.pending_calls, {})
+
+
+class TestBatchedPublish(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.published = []
+        publish = AsyncMock(side_effect=lambda data, reliable: self.published.append(data))
+        room = SimpleNamespace(local_participant=SimpleNamespace(publish_data=publish))
+        self.manager = ClientToolManager(SimpleNamespace(room=room), batch_tool_calls=True)
+
+    async def _run(self, *names):
+        handlers = [_make_handler(self.manager, name) for name in names]
+        with patch.object(client, "get_current_room", return_value=None), \
+                patch.object(client, "TOOL_CALL_TIMEOUT_SECONDS", 0.05):
+            return await asyncio.gather(*(handler({}, None) for handler in handlers))
+
+    async def test_parallel_calls_share_one_publish(self):
+        """Test calls issued together are sent in a single batch envelope."""
+        await self._run("open_panel", "close_panel")
+
+        self.assertEqual(len(self.published), 1)
+        envelope = json.loads(self.published[0])
+        self.assertEqual(envelope["type"], "tool_calls_batch")
+        self.assertEqual(
+            [call["function"]["name"] for call in envelope["calls"]],
+            ["open_panel", "close_panel"],
+        )
+
+    async def test_single_call_keeps_plain_envelope(self):
+        """Test a lone call is still published as a plain tool_call."""
+        await self._run("open_panel")
+
+        self.assertEqual(json.loads(self.published[0])["type"], "tool_call")
+
+
+class TestMsgpackPublish(unittest.IsolatedAsyncioTestCase):
+
+    async def test_tool_call_published_as_msgpack(self):
+        """Test msgpack_tool_calls publishes MessagePack on the .mp topic."""
+        published = []
+        publish = AsyncMock(side_effect=lambda data, reliable, topic: published.append((data, topic)))
+        room = SimpleNamespace(local_participant=SimpleNamespace(publish_data=publish))
+        manager = ClientToolManager(SimpleNamespace(room=room), msgpack_tool_calls=True)
+        handler = _make_handler(manager)
+
+        with patch.object(client, "get_current_room", return_value=None), \
+                patch.object(client, "TOOL_CALL_TIMEOUT_SECONDS", 0.01):
+            await handler({"panel": "settings"}, None)
+
+        data, topic = published[0]
+        self.assertEqual(topic, client.TOOL_CALL_MSGPACK_TOPIC)
+        payload = decode_packet(data, topic)
+        self.assertEqual(payload["type"], "tool_call")
+        self.assertEqual(payload["function"]["arguments"], '{"panel":"settings"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Unit tests for configuration message handlers."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Note: livekit mocking is done in conftest.py
+from src.config import KwamiConfig
+from src.handlers import config_handler
+from src.handlers.config_handler import (
+    _new_config,
+    _update_tts_options,
+    handle_full_config,
+    update_llm,
+)
+
+
+def _make_agent() -> SimpleNamespace:
+    """Create a stand-in agent with a plugin-style TTS."""
+    tts_cls = type("TTS", (), {"__module__": "livekit.plugins.cartesia.tts"})
+    tts = tts_cls()
+    tts.update_options = MagicMock()
+    return SimpleNamespace(kwami_config=KwamiConfig(), tts=tts)
+
+
+class TestUpdateTTSOptions(unittest.IsolatedAsyncioTestCase):
+
+    async def test_unchanged_values_are_skipped(self):
+        """Test repeated voice/speed values don't reach the provider."""
+        agent = _make_agent()
+        voice = agent.kwami_config.voice
+
+        await _update_tts_options(agent, {"tts_speed": voice.tts_speed}, voice.tts_voice)
+
+        agent.tts.update_options.assert_not_called()
+
+    async def test_only_changed_values_are_sent(self):
+        """Test only the delta is sent and written back to the config."""
+        agent = _make_agent()
+        voice = agent.kwami_config.voice
+
+        await _update_tts_options(agent, {"tts_speed": 1.5}, voice.tts_voice)
+
+        agent.tts.update_options.assert_called_once_with(speed=1.5)
+        self.assertEqual(voice.tts_speed, 1.5)
+
+
+class TestNewConfig(unittest.TestCase):
+
+    def test_clone_matches_defaults_without_sharing(self):
+        """Test cloned configs equal a fresh KwamiConfig but share no mutable state."""
+        first = _new_config()
+        second = _new_config()
+
+        self.assertEqual(first, KwamiConfig())
+        self.assertIsNot(first.voice, second.voice)
+        self.assertIsNot(first.soul.traits, second.soul.traits)
+        self.assertIsNot(first.tools, second.tools)
+
+
+class TestHandleFullConfig(unittest.IsolatedAsyncioTestCase):
+
+    current_agent = None
+
+    async def _run(self, message: dict) -> MagicMock:
+        create_agent = MagicMock()
+        state = SimpleNamespace(
+            user_identity="user",
+            greeting_delivered=True,
+            current_agent=self.current_agent,
+            update_agent=MagicMock(),
+        )
+        with patch.object(config_handler, "start_memory"):
+            await handle_full_config(MagicMock(), state, message, None, create_agent)
+        return create_agent
+
+    async def _apply(self, message: dict) -> KwamiConfig:
+        return (await self._run(message)).call_args.args[0]
+
+    async def test_voice_and_soul_fields(self):
+        """Test mapped fields are applied and model prefixes stripped."""
+        config = await self._apply({
+            "voice": {
+                "llm": {"provider": "openai", "model": "openai/gpt-4.1-mini", "temperature": 0},
+                "tts": {"voice": "nova", "speed": ""},
+            },
+            "soul": {"name": "Nova", "conversation_style": "formal"},
+        })
+
+        self.assertEqual(config.voice.llm_model, "gpt-4.1-mini")
+        self.assertEqual(config.voice.llm_temperature, 0)
+        self.assertEqual(config.voice.tts_voice, "nova")
+        self.assertEqual(config.voice.tts_speed, KwamiConfig().voice.tts_speed)
+        self.assertEqual(config.soul.name, "Nova")
+        self.assertEqual(config.soul.conversation_style, "formal")
+
+    async def test_zero_max_tokens_is_ignored(self):
+        """Test maxTokens 0 keeps the default instead of disabling output."""
+        config = await self._apply({"voice": {"llm": {"maxTokens": 0, "temperature": 0}}})
+
+        self.assertEqual(config.voice.llm_max_tokens, KwamiConfig().voice.llm_max_tokens)
+        self.assertEqual(config.voice.llm_temperature, 0)
+
+    async def test_unchanged_voice_reuses_pipeline(self):
+        """Test a config repeating the current voice hands over the live pipeline."""
+        self.current_agent = SimpleNamespace(
+            kwami_config=KwamiConfig(), stt="stt", llm="llm", tts="tts"
+        )
+        create_agent = await self._run({"soul": {"name": "Nova"}})
+
+        self.assertEqual(
+            create_agent.call_args.kwargs["pipeline"], {"stt": "stt", "llm": "llm", "tts": "tts"}
+        )
+
+    async def test_identical_config_keeps_agent(self):
+        """Test re-sending the live config doesn't rebuild the agent."""
+        config = KwamiConfig()
+        config.soul.name = "Nova"
+        self.current_agent = SimpleNamespace(kwami_config=config)
+
+        create_agent = await self._run({"soul": {"name": "Nova"}})
+
+        create_agent.assert_not_called()
+
+
+class TestUpdateLLM(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        config = KwamiConfig()
+        config.voice.llm_provider = "groq"
+        self.agent = SimpleNamespace(kwami_config=config, llm=MagicMock(), _memory=None)
+        self.state = MagicMock()
+        self.create_agent = MagicMock()
+
+    async def _update(self, config: dict) -> None:
+        await update_llm(MagicMock(), self.state, self.agent, config, None, self.create_agent)
+
+    async def test_same_provider_updates_in_place(self):
+        """Test model/temperature changes reuse the live LLM."""
+        await self._update({"model": "groq/llama-3.3-70b", "temperature": 0})
+
+        self.agent.llm.update_options.assert_called_once_with(
+            model="llama-3.3-70b", temperature=0
+        )
+        self.assertEqual(self.agent.kwami_config.voice.llm_temperature, 0)
+        self.create_agent.assert_not_called()
+
+    async def test_unchanged_config_is_ignored(self):
+        """Test an update repeating the current settings does nothing."""
+        voice = self.agent.kwami_config.voice
+        await self._update({"model": voice.llm_model, "temperature": voice.llm_temperature})
+
+        self.agent.llm.update_options.assert_not_called()
+        self.create_agent.assert_not_called()
+
+    async def test_provider_change_recreates_agent(self):
+        """Test switching provider builds a new agent."""
+        await self._update({"provider": "openai", "model": "gpt-4o-mini"})
+
+        self.agent.llm.update_options.assert_not_called()
+        self.assertEqual(self.create_agent.call_args.args[0].voice.llm_provider, "openai")
+        self.state.update_agent.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
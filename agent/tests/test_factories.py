@@ -7,9 +7,12 @@ from unittest.mock import patch, MagicMock
 
 
 from src.config import KwamiVoiceConfig
+from src.factories.llm import create_llm
+from src.factories.realtime import create_realtime_model, _server_vad_options
 from src.factories.tts import create_tts, _create_openai_tts
 from src.factories.stt import create_stt
-from src.constants import TTSProviders, STTProviders, OpenAIVoices, OpenAIModels
+from src.factories.vad import create_vad, _load_silero_vad
+from src.constants import TTSProviders, STTProviders, OpenAIVoices, OpenAIModels, DeepgramVoices
 
 
 class TestFactories(unittest.TestCase):
@@ -58,6 +61,32 @@ class TestFactories(unittest.TestCase):
             speed=1.0
         )
 
+    @patch("src.factories.tts.deepgram.TTS")
+    def test_create_deepgram_tts_model(self, mock_deepgram_tts):
+        """Test the Aura model is derived from the voice when none is given."""
+        config = KwamiVoiceConfig(
+            tts_provider=TTSProviders.DEEPGRAM,
+            tts_model="",
+            tts_voice=DeepgramVoices.ORION,
+        )
+
+        create_tts(config)
+
+        mock_deepgram_tts.assert_called_once_with(model="aura-orion-en")
+
+    @patch("src.factories.llm.openai.LLM")
+    def test_create_openai_compatible_llm(self, mock_openai_llm):
+        """Test OpenAI-compatible providers use their constructor and default model."""
+        config = KwamiVoiceConfig(llm_provider="mistral", llm_model="", llm_temperature=0.3)
+
+        create_llm(config)
+
+        mock_openai_llm.with_x_ai.assert_called_once_with(
+            model="mistral-large-latest",
+            temperature=0.3,
+            base_url="https://api.mistral.ai/v1",
+        )
+
     @patch("src.factories.stt.deepgram.STT")
     def test_create_deepgram_stt(self, mock_deepgram_stt):
         """Test creating Deepgram STT."""
@@ -74,6 +103,36 @@ class TestFactories(unittest.TestCase):
         self.assertEqual(call_args["model"], "nova-2-medical")
         self.assertEqual(call_args["language"], "fr")
 
+    @patch("src.factories.vad.silero.VAD.load")
+    def test_create_vad_is_cached(self, mock_vad_load):
+        """Test equal VAD settings reuse one loaded model."""
+        _load_silero_vad.cache_clear()
+        config = KwamiVoiceConfig(vad_min_speech_duration=0.1, vad_min_silence_duration=0.3)
+
+        first = create_vad(config)
+        second = create_vad(
+            KwamiVoiceConfig(vad_min_speech_duration=0.1, vad_min_silence_duration=0.3)
+        )
+
+        self.assertIs(first, second)
+        mock_vad_load.assert_called_once_with(min_speech_duration=0.1, min_silence_duration=0.3)
+
+    @patch("src.factories.realtime.openai.realtime")
+    def test_realtime_vad_options_are_shared(self, mock_realtime):
+        """Test equal VAD settings reuse one ServerVadOptions instance."""
+        _server_vad_options.cache_clear()
+        configs = [
+            KwamiVoiceConfig(realtime_provider="openai", vad_min_silence_duration=0.3)
+            for _ in range(2)
+        ]
+
+        for config in configs:
+            create_realtime_model(config)
+
+        mock_realtime.ServerVadOptions.assert_called_once_with(
+            threshold=config.vad_threshold, prefix_padding_ms=300, silence_duration_ms=300
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,103 @@
+"""Unit tests for session entrypoint helpers."""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Note: livekit mocking is done in conftest.py
+from src import main
+from src.main import _enqueue_config_message, _merge_config_updates, _record_metrics
+
+
+def _update(update_type: str, config) -> dict:
+    return {"type": "config_update", "updateType": update_type, "config": config}
+
+
+class TestMergeConfigUpdates(unittest.TestCase):
+
+    def test_same_type_merges_payloads(self):
+        """Test later keys win and earlier keys are kept."""
+        merged = _merge_config_updates(
+            _update("voice", {"tts_speed": 1.1, "tts_voice": "nova"}),
+            _update("voice", {"tts_speed": 1.4}),
+        )
+
+        self.assertEqual(merged["config"], {"tts_speed": 1.4, "tts_voice": "nova"})
+
+    def test_different_messages_do_not_merge(self):
+        """Test other update types and full configs are kept separate."""
+        voice = _update("voice", {"tts_speed": 1.1})
+
+        self.assertIsNone(_merge_config_updates(voice, _update("llm", {"temperature": 0.2})))
+        self.assertIsNone(_merge_config_updates(voice, {"type": "config"}))
+
+
+class TestEnqueueConfigMessage(unittest.TestCase):
+
+    def _drain(self, queue: asyncio.Queue) -> list:
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    def test_full_queue_drops_oldest_update_not_config(self):
+        """Test overflow evicts the oldest config_update and keeps a pending config."""
+        queue = asyncio.Queue(maxsize=3)
+        config = {"type": "config", "kwamiId": "k1"}
+        for message in (config, _update("voice", {"a": 1}), _update("voice", {"a": 2})):
+            queue.put_nowait(message)
+
+        _enqueue_config_message(queue, _update("voice", {"a": 3}))
+
+        self.assertEqual(
+            self._drain(queue),
+            [config, _update("voice", {"a": 2}), _update("voice", {"a": 3})],
+        )
+
+    def test_full_queue_of_configs_drops_oldest_config(self):
+        """Test a queue holding only full configs drops the superseded oldest one."""
+        queue = asyncio.Queue(maxsize=2)
+        queue.put_nowait({"type": "config", "kwamiId": "k1"})
+        queue.put_nowait({"type": "config", "kwamiId": "k2"})
+
+        _enqueue_config_message(queue, _update("voice", {"a": 1}))
+
+        self.assertEqual(
+            self._drain(queue),
+            [{"type": "config", "kwamiId": "k2"}, _update("voice", {"a": 1})],
+        )
+
+
+class TestRecordMetrics(unittest.TestCase):
+
+    def test_metrics_routed_by_type(self):
+        """Test each metrics type reaches the matching tracker method."""
+        tracker = MagicMock()
+        metrics = SimpleNamespace(type="tts_metrics")
+
+        _record_metrics(tracker, SimpleNamespace(metrics=metrics))
+        _record_metrics(tracker, SimpleNamespace(metrics=SimpleNamespace(type="vad_metrics")))
+
+        tracker.on_tts_metrics.assert_called_once_with(metrics)
+        tracker.on_llm_metrics.assert_not_called()
+
+
+class TestConsumeConfigMessages(unittest.IsolatedAsyncioTestCase):
+
+    async def test_burst_is_applied_once(self):
+        """Test queued updates of one kind are applied as a single update."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for speed in (1.1, 1.2, 1.3):
+            queue.put_nowait(_update("voice", {"tts_speed": speed}))
+        queue.put_nowait(_update("llm", {"temperature": 0.2}))
+
+        with patch.object(main, "handle_config_update", AsyncMock()) as handle, \
+                patch.object(main, "CONFIG_UPDATE_DEBOUNCE_SECONDS", 0):
+            consumer = asyncio.create_task(main._consume_config_messages(None, None, None, queue))
+            await asyncio.sleep(0.01)
+            consumer.cancel()
+
+        applied = [call.args[2]["config"] for call in handle.await_args_list]
+        self.assertEqual(applied, [{"tts_speed": 1.3}, {"temperature": 0.2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
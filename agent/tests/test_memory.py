@@ -0,0 +1,263 @@
+"""Unit tests for memory message persistence."""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+# Note: zep mocking is done in conftest.py
+from src.config import KwamiMemoryConfig
+from src.memory import context as memory_context
+from src.memory import manager
+from src.memory.context import _is_assistant_fact, get_context, setup_context_template
+from src.memory.manager import KwamiMemory, start_memory
+
+
+def _make_memory() -> KwamiMemory:
+    """Create an initialized memory with a stubbed Zep client."""
+    memory = KwamiMemory(KwamiMemoryConfig(), kwami_id="k1")
+    memory._client = SimpleNamespace(
+        thread=SimpleNamespace(add_messages=AsyncMock()),
+        close=AsyncMock(),
+    )
+    memory._session_id = "session"
+    memory._initialized = True
+    return memory
+
+
+class TestMessageWriter(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        # Messages are built as plain namespaces carrying the Zep fields
+        patcher = patch.object(
+            manager, "get_zep_imports", return_value=(None, SimpleNamespace, None)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_queued_turns_are_written_in_one_call(self):
+        """Test turns queued before the writer runs share one add_messages call."""
+        memory = _make_memory()
+        add_messages = memory._client.thread.add_messages
+
+        await memory.buffer_user_message("hello")
+        await memory.add_exchange("hi there")
+        await memory.buffer_user_message("how are you?")
+        await memory.add_exchange("great")
+        await memory.close()
+
+        add_messages.assert_awaited_once()
+        batch = add_messages.await_args.kwargs["messages"]
+        self.assertEqual(
+            [m.content for m in batch], ["hello", "hi there", "how are you?", "great"]
+        )
+        self.assertIsNone(memory._writer_task)
+
+    async def test_system_messages_are_written_separately(self):
+        """Test entries with different ignore_roles are not merged."""
+        memory = _make_memory()
+        add_messages = memory._client.thread.add_messages
+
+        await memory.add_exchange("hi there")
+        await memory.add_fact("User likes tea")
+        await memory._write_queue.join()
+
+        self.assertEqual(add_messages.await_count, 2)
+        self.assertEqual(add_messages.await_args_list[0].kwargs["ignore_roles"], ["assistant"])
+        self.assertIsNone(add_messages.await_args_list[1].kwargs["ignore_roles"])
+
+    async def test_facts_share_one_write(self):
+        """Test facts remembered in a burst are written together."""
+        memory = _make_memory()
+        add_messages = memory._client.thread.add_messages
+
+        await memory.add_fact("User likes tea")
+        await memory.add_fact("User lives in Lisbon")
+        await memory._write_queue.join()
+
+        add_messages.assert_awaited_once()
+        self.assertEqual(len(add_messages.await_args.kwargs["messages"]), 2)
+
+    async def test_context_is_cached_until_write(self):
+        """Test repeated context reads reuse one fetch until memory is written."""
+        memory = _make_memory()
+
+        with patch.object(manager, "get_context", AsyncMock(return_value="context")) as fetch:
+            self.assertEqual(await memory.get_context(), "context")
+            await memory.get_context()
+            self.assertEqual(fetch.await_count, 1)
+
+            await memory.add_fact("User likes tea")
+            await memory.get_context()
+            await memory.get_context(bypass_cache=True)
+            self.assertEqual(fetch.await_count, 3)
+        await memory.close()
+
+
+class TestStartMemory(unittest.IsolatedAsyncioTestCase):
+
+    def test_disabled_memory_returns_none(self):
+        """Test no memory is created when it is disabled."""
+        self.assertIsNone(start_memory(KwamiMemoryConfig(enabled=False), kwami_id="k1"))
+
+    async def test_initializes_in_background(self):
+        """Test initialization runs as a task and can be awaited later."""
+        async def initialize(memory):
+            memory._initialized = True
+            return True
+
+        config = KwamiMemoryConfig(enabled=True, api_key="key")
+        with patch.object(KwamiMemory, "initialize", autospec=True, side_effect=initialize):
+            memory = start_memory(config, kwami_id="k1")
+            self.assertFalse(memory.is_initialized)
+
+            self.assertTrue(await memory.wait_until_ready())
+
+    async def test_close_during_initialization(self):
+        """Test waiters see False, not CancelledError, when close() cancels init."""
+        async def initialize(memory):
+            await asyncio.sleep(10)
+            return True
+
+        config = KwamiMemoryConfig(enabled=True, api_key="key")
+        with patch.object(KwamiMemory, "initialize", autospec=True, side_effect=initialize):
+            memory = start_memory(config, kwami_id="k1")
+            waiter = asyncio.create_task(memory.wait_until_ready())
+            await asyncio.sleep(0)
+
+            await memory.close()
+
+            self.assertFalse(await waiter)
+
+    async def test_context_is_prefetched(self):
+        """Test the first context and user name reads reuse the warm-up requests."""
+        async def initialize(memory):
+            memory._client = SimpleNamespace(close=AsyncMock())
+            memory._initialized = True
+            return True
+
+        config = KwamiMemoryConfig(enabled=True, api_key="key")
+        with patch.object(KwamiMemory, "initialize", autospec=True, side_effect=initialize), \
+                patch.object(manager, "get_context", AsyncMock(return_value="context")) as fetch, \
+                patch.object(manager, "get_user_name", AsyncMock(return_value="Ana")) as lookup:
+            memory = start_memory(config, kwami_id="k1")
+            await memory.wait_until_ready()
+
+            self.assertEqual(await memory.get_user_name(), "Ana")
+            self.assertEqual(await memory.get_context(), "context")
+            await memory.close()
+
+        fetch.assert_awaited_once()
+        lookup.assert_awaited_once()
+
+
+def _make_zep_client(template_context=None) -> SimpleNamespace:
+    """Create a Zep client stub for context retrieval."""
+    message = SimpleNamespace(role="user", role_type="user", content="hi")
+    return SimpleNamespace(
+        thread=SimpleNamespace(
+            get_user_context=AsyncMock(return_value=SimpleNamespace(context=template_context)),
+            get_context=AsyncMock(return_value=SimpleNamespace(context="summary")),
+            get_messages=AsyncMock(return_value=SimpleNamespace(messages=[message])),
+        ),
+        graph=SimpleNamespace(
+            search=AsyncMock(return_value=SimpleNamespace(
+                edges=[SimpleNamespace(fact="User likes tea", invalid_at=None)]
+            )),
+        ),
+    )
+
+
+class TestGetContext(unittest.IsolatedAsyncioTestCase):
+
+    async def test_template_skips_fallback(self):
+        """Test a template context block avoids the fallback requests."""
+        client = _make_zep_client(template_context="block")
+
+        context = await get_context(client, "user", "session", template_id="tpl")
+
+        self.assertEqual(context.context_block, "block")
+        self.assertEqual(context.recent_messages, [{"role": "user", "content": "hi"}])
+        client.thread.get_context.assert_not_awaited()
+        client.graph.search.assert_not_awaited()
+
+    async def test_fallback_combines_results(self):
+        """Test the summary, facts and messages fallback results are all kept."""
+        client = _make_zep_client()
+        client.thread.get_messages.side_effect = RuntimeError("unavailable")
+
+        context = await get_context(client, "user", "session", template_id="tpl")
+
+        self.assertEqual(context.summary, "summary")
+        self.assertEqual(context.facts, ["User likes tea"])
+        self.assertEqual(context.recent_messages, [])
+
+    async def test_duplicate_facts_are_dropped(self):
+        """Test repeated facts are kept once, but an expired version is kept too."""
+        client = _make_zep_client()
+        client.graph.search.return_value.edges = [
+            SimpleNamespace(fact="User likes tea", invalid_at=None),
+            SimpleNamespace(fact="user likes tea", invalid_at=None),
+            SimpleNamespace(fact="User likes tea", invalid_at="2024-01-01"),
+        ]
+
+        context = await get_context(client, "user", "session")
+
+        self.assertEqual(
+            context.facts,
+            ["User likes tea", "User likes tea (no longer valid since 2024-01-01)"],
+        )
+
+    async def test_malformed_edge_is_skipped(self):
+        """Test an edge missing its fields doesn't drop the other facts."""
+        client = _make_zep_client()
+        client.graph.search.return_value.edges = [
+            SimpleNamespace(fact="User likes tea"),
+            SimpleNamespace(fact="User lives in Paris", invalid_at=None),
+        ]
+
+        context = await get_context(client, "user", "session")
+
+        self.assertEqual(context.facts, ["User lives in Paris"])
+
+    async def test_template_setup_runs_once(self):
+        """Test an unchanged template is only written to Zep once."""
+        memory_context._template_setup_cache.clear()
+        update = AsyncMock()
+        client = SimpleNamespace(context=SimpleNamespace(update_context_template=update))
+
+        first = await setup_context_template(client, "user")
+        second = await setup_context_template(client, "user")
+
+        self.assertEqual(first, second)
+        update.assert_awaited_once()
+
+    async def test_template_created_only_when_missing(self):
+        """Test a missing template is created but other update errors are not retried."""
+        memory_context._template_setup_cache.clear()
+        create = AsyncMock()
+        client = SimpleNamespace(context=SimpleNamespace(
+            update_context_template=AsyncMock(side_effect=RuntimeError("timeout")),
+            create_context_template=create,
+        ))
+
+        self.assertIsNone(await setup_context_template(client, "user"))
+        create.assert_not_awaited()
+
+        client.context.update_context_template.side_effect = RuntimeError("template not found")
+        self.assertEqual(await setup_context_template(client, "user"), "kwami-context-user")
+        create.assert_awaited_once()
+
+
+class TestIsAssistantFact(unittest.TestCase):
+
+    def test_identity_facts_are_detected(self):
+        """Test facts describing the assistant are told apart from user facts."""
+        self.assertTrue(_is_assistant_fact("Nova is an AI assistant", "nova"))
+        self.assertTrue(_is_assistant_fact("The user called Nova earlier", "nova"))
+        self.assertTrue(_is_assistant_fact("Said: I am Nova", "nova"))
+        self.assertFalse(_is_assistant_fact("User lives in Casanova street", "nova"))
+
+
+if __name__ == "__main__":
+    unittest.main()
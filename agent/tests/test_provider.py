@@ -0,0 +1,101 @@
+"""Unit tests for provider utilities."""
+
+import unittest
+
+from src.constants import CartesiaVoices
+from src.utils.provider import (
+    build_tts_updates,
+    detect_provider_change,
+    detect_tts_provider_from_model,
+    detect_tts_provider_from_voice,
+    resolve_cartesia_voice,
+)
+
+
+def _fake_tts(module: str, model: str = ""):
+    """Create a stand-in TTS object whose class lives in the given module."""
+    cls = type("TTS", (), {"__module__": module})
+    tts = cls()
+    tts.model = model
+    return tts
+
+
+class TestBuildTTSUpdates(unittest.TestCase):
+
+    def test_openai_voice_and_speed(self):
+        """Test plugin TTS receives both voice and speed."""
+        tts = _fake_tts("livekit.plugins.openai.tts")
+        self.assertEqual(
+            build_tts_updates(tts, voice="nova", speed=1.5),
+            {"voice": "nova", "speed": 1.5},
+        )
+
+    def test_direct_elevenlabs_uses_voice_id(self):
+        """Test the direct ElevenLabs plugin uses 'voice_id'."""
+        tts = _fake_tts("livekit.plugins.elevenlabs.tts")
+        self.assertEqual(build_tts_updates(tts, voice="abc"), {"voice_id": "abc"})
+
+    def test_inference_tts_uses_voice_and_skips_speed(self):
+        """Test LiveKit Inference TTS uses 'voice' and ignores speed."""
+        tts = _fake_tts("livekit.agents.inference.tts", model="elevenlabs/eleven_turbo_v2_5")
+        self.assertEqual(
+            build_tts_updates(tts, voice="abc", speed=1.2),
+            {"voice": "abc"},
+        )
+
+
+class TestResolveCartesiaVoice(unittest.TestCase):
+
+    def test_friendly_name_any_case(self):
+        """Test friendly names resolve regardless of case."""
+        self.assertEqual(resolve_cartesia_voice("British Lady"), CartesiaVoices.BRITISH_LADY)
+
+    def test_unknown_name_passes_through(self):
+        """Test unknown names and raw IDs are returned unchanged."""
+        self.assertEqual(resolve_cartesia_voice("Custom-ID"), "Custom-ID")
+
+
+class TestDetectProviderChange(unittest.TestCase):
+
+    def test_model_prefix_changes_provider(self):
+        """Test a prefixed model name switches provider."""
+        self.assertEqual(
+            detect_provider_change("openai", new_model="cartesia/sonic-2"),
+            ("cartesia", True),
+        )
+
+    def test_same_provider_voice(self):
+        """Test an OpenAI voice keeps the OpenAI provider."""
+        self.assertEqual(
+            detect_provider_change("openai", new_voice="alloy"),
+            ("openai", False),
+        )
+
+
+class TestDetectTTSProvider(unittest.TestCase):
+
+    def test_model_patterns(self):
+        """Test model names map to providers by prefix."""
+        cases = {
+            "eleven_turbo_v2_5": "elevenlabs",
+            "gpt-4o-mini-tts": "openai",
+            "sonic-2": "cartesia",
+            "aura-asteria-en": "deepgram",
+            "rime/arcana": "rime",
+            "nova-2": None,
+        }
+        for model, provider in cases.items():
+            self.assertEqual(detect_tts_provider_from_model(model), provider, model)
+
+    def test_voice_formats(self):
+        """Test voice ID formats map to providers."""
+        self.assertEqual(detect_tts_provider_from_voice("JBFqnCBsd6RMkjVDRZzb"), "elevenlabs")
+        self.assertEqual(
+            detect_tts_provider_from_voice("79a125e8-cd45-4c13-8a67-188112f4dd22"), "cartesia"
+        )
+        self.assertEqual(detect_tts_provider_from_voice("Nova"), "openai")
+        self.assertIsNone(detect_tts_provider_from_voice("not-a-known-voice"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Unit tests for room utilities."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Note: livekit mocking is done in conftest.py
+from src.utils.room import should_disconnect_as_duplicate
+
+AGENT = "agent"
+
+
+class _FakeRoom:
+    """Minimal room with remote participants and event registration."""
+
+    def __init__(self, *participants):
+        self.remote_participants = {p.identity: p for p in participants}
+        self.handlers = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    def off(self, event, handler):
+        self.handlers.remove(handler)
+
+
+def _agent(identity: str, connected: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(identity=identity, kind=AGENT, is_connected=connected)
+
+
+@patch("src.utils.room.ParticipantKind", SimpleNamespace(AGENT=AGENT))
+class TestDuplicateDetection(unittest.IsolatedAsyncioTestCase):
+
+    async def test_agent_with_priority_present(self):
+        """Test an older connected agent makes this one disconnect without waiting."""
+        room = _FakeRoom(_agent("agent-a"))
+
+        self.assertTrue(await should_disconnect_as_duplicate(room, "agent-b", [10.0]))
+
+    async def test_this_agent_has_priority(self):
+        """Test this agent stays when its identity sorts first."""
+        room = _FakeRoom(_agent("agent-c"), _agent("agent-a", connected=False))
+
+        self.assertFalse(await should_disconnect_as_duplicate(room, "agent-b", [10.0]))
+
+    async def test_no_other_agents(self):
+        """Test the wait handler is removed when no agent joins."""
+        room = _FakeRoom()
+
+        self.assertFalse(await should_disconnect_as_duplicate(room, "agent-b", [0.01]))
+        self.assertEqual(room.handlers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Unit tests for data channel serialization helpers."""
+
+import unittest
+
+from src.utils import serialization
+from src.utils.serialization import decode_packet, dumps, is_message_packet, loads, pack
+
+
+class TestDumps(unittest.TestCase):
+
+    def test_round_trip(self):
+        """Test dumps emits bytes that decode back to the same object."""
+        payload = {"type": "tool_call", "function": {"name": "a", "arguments": "{}"}}
+        data = dumps(payload)
+
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(loads(data), payload)
+
+    def test_compact_utf8_output(self):
+        """Test dumps emits compact UTF-8 JSON."""
+        self.assertEqual(dumps({"a": [1, "é"]}), '{"a":[1,"é"]}'.encode())
+
+
+class TestDecodePacket(unittest.TestCase):
+
+    def test_json_packet(self):
+        """Test packets without a MessagePack topic are parsed as JSON."""
+        self.assertEqual(decode_packet(b'{"type": "config"}', None), {"type": "config"})
+        self.assertEqual(decode_packet(b'{"type": "config"}', "kwami"), {"type": "config"})
+
+    def test_msgpack_packet(self):
+        """Test packets on a MessagePack topic are decoded with msgpack."""
+        payload = {"type": "tool_result", "toolCallId": "call_1", "result": "ok"}
+        self.assertEqual(decode_packet(pack(payload), "tool_result.mp"), payload)
+
+    def test_invalid_msgpack_packet(self):
+        """Test a malformed MessagePack packet raises ValueError."""
+        with self.assertRaises(ValueError):
+            decode_packet(b"\x81", "tool_result.mp")
+
+
+class TestIsMessagePacket(unittest.TestCase):
+
+    def test_json_object_and_msgpack_topic(self):
+        """Test JSON objects and MessagePack topics are accepted."""
+        self.assertTrue(is_message_packet(b'{"type": "config"}'))
+        self.assertTrue(is_message_packet(b"\x82\xa4type", "tool_result.mp"))
+
+    def test_foreign_and_oversized_packets(self):
+        """Test empty, non-object and oversized payloads are skipped."""
+        self.assertFalse(is_message_packet(b""))
+        self.assertFalse(is_message_packet(b"\x00\x01binary"))
+        self.assertFalse(is_message_packet(b"[1, 2]", "chat"))
+        self.assertFalse(is_message_packet(b"{" + b" " * serialization.MAX_MESSAGE_BYTES))
+
+
+if __name__ == "__main__":
+    unittest.main()